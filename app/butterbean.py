@@ -2,17 +2,26 @@
 #author: Tupperward
 
 #Importing dependencies
-import discord, os , random, re
+import csv, discord, io, os, time
 
 from time import sleep
 
-from discord.ext import commands
+from discord import app_commands
+from discord.ext import commands, tasks
 from discord.utils import get
-
-from modules.tarot_data import tarotData
-
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from modules.tarot import loadDeck
+from modules.welcome import ReactionSeeder, JoinBatcher, mentionChunks
+from modules.role_index import RoleIndex
+from modules.rate_limit import RateLimited, throttle
+from modules.link_rewriter import LinkGate, LinkRules, linksMessage, loadLinkRules
+from modules.meme_index import MemeIndex
+from modules.link_checker import LinkChecker, checkIntervalHours
+from modules import database, meme_io, metrics, migrations
+from modules.watchdog import LoopWatchdog
+from modules.random_content import RandomPicker
+from modules.repositories import MemeRepository, QuoteRepository
 
 from github import Github
 
@@ -41,12 +50,43 @@ async def on_ready():
     print('Syncing command tree...')
     known_commands = await client.tree.sync()
     print('Command tree synced. {0} commands in tree.'.format(len(known_commands)))
+    for guild in client.guilds:
+        roleIndex.build(guild)
+
+#---------------- Metrics ----------------
+#Served from /metrics on METRICS_PORT. Command timings start when a command is invoked and stop when it completes or fails.
+metrics.Callback('butterbean_gateway_latency_seconds', 'Discord gateway heartbeat latency', lambda: client.latency)
+
+def observeCommand(ctx, outcome: str):
+    start = getattr(ctx, 'metricsStart', None)
+    if start is not None and ctx.command is not None:
+        metrics.commandLatency.observe(time.perf_counter() - start, ctx.command.qualified_name, outcome)
+
+@client.listen()
+async def on_command(ctx):
+    ctx.metricsStart = time.perf_counter()
+
+@client.listen()
+async def on_command_completion(ctx):
+    observeCommand(ctx, 'ok')
+
+#Tells people when they're being rate limited, everything else goes to the default error handler
+@client.event
+async def on_command_error(ctx, error):
+    if isinstance(error, RateLimited):
+        observeCommand(ctx, 'rate_limited')
+        metrics.rateLimitHits.inc(ctx.command.qualified_name, error.scope)
+        await ctx.send("Slow down! Try that again in {:.0f} seconds.".format(error.retryAfter + 0.5), ephemeral=True)
+    else:
+        observeCommand(ctx, 'error')
+        await commands.Bot.on_command_error(client, ctx, error)
 
 access_token = os.environ.get('GITHUB_ACCESS_TOKEN')
 repo_name = os.environ.get('GITHUB_REPO_NAME')
 mod_name = os.environ.get('MOD_NAME')
 bot_mod_name = os.environ.get('BOT_MOD_NAME')
 restricted_roles = ['sheriff','admin','Da Hosts','Dr. Wily','technomancer','PatreonBot','bird-expert','time-out-corner','Butterborg']
+roleIndex = RoleIndex(restricted_roles)
 welcome_channel_id = 465991895693393929
 emojis = ['😎', '😇', '😊', '🧐', '🤩', '😏', '😩', '😤', '👐', '🤟', '👏', '🖖', '🙌', '🤙', '🦾']
 role_emojis = {
@@ -68,12 +108,46 @@ role_emojis = {
 }
 greetMessage = "<:folks:468426186478059532>, welcome to the What a Time to Be Alive discord, the only discord server discussing the podcast counting down the things this week that made you say the thing that's the title of the podcast!\n\nPlease take your time to read #rules-and-info and then, if you're comfortable, use the **/pickpronoun** command to privately tag yourself with your pronouns." + "\n\nYou can also react to this message with your pronouns. This server allows you to set a primary and secondary pronoun role, with your name changing color to reflect your primary pronouns." + "\n\n**Primary Pronouns:** (pick just one)\n😎: `any/all`  😇: `he/` 😊: `she/` 🧐: `they/` 🤩: `xe/` 😏: `ze/` 😩: `fae/` 😤: `it/`" +  "\n\n**Secondary Pronouns:** (pick as many as you'd like!)\n 👐: `/him` 🤟: `/her` 👏: `/them` 🖖: `/xer` 🙌: `/zir` 🤙: `/faer` 🦾: `/its`" + "\n\nFeel free to reach out to any of our mods for any reason, they're always happy to talk: criss (@.crissxcore), mx. president (@kbuechner) or AR (@armoredrobot2.0)." + "\n\nThis server also uses this bot for meme purposes. Be on the lookout for memes you can send using by sending **/bb** and the name of the meme. You can find a list of those memes with **/beanfo**. __I'll be honest, most of these are currently broken because of imgur deleting basically everything__."
 timeyIcon = 'https://i.imgur.com/vtkIVnl.png'
+reactionSeeder = ReactionSeeder(emojis)
 unapprovedDeny = "Uh uh uh! {0} didn't say the magic word!\nhttps://imgur.com/IiaYjzH.gif"
 
 
 #---------------- Database Init ----------------
-#Starts the db engine with sqlalchemy.
-engine = create_engine("sqlite+pysqlite:///db/butterbean.db", echo=True, future=True)
+#The db engine lives in modules/database.py and every query goes through its thread pool.
+#Every meme is loaded into memory once so /bb lookups never hit the db. add and remove keep it in sync.
+memeIndex = MemeIndex()
+memes = MemeRepository()
+#Links found dead by the background scanner, so /bb can own up to them
+linkChecker = LinkChecker()
+
+#Watches for anything blocking the event loop. Stalls are logged, and mods can see them with /loophealth.
+watchdog = LoopWatchdog()
+
+@client.event
+async def setup_hook():
+    global linkRules
+    applied = await database.runInExecutor(migrations.migrate)
+    if applied:
+        print('Applied database migrations {}'.format(applied))
+    memeIndex.load(await memes.all())
+    linkRules = await loadLinkRules()
+    await linkChecker.load()
+    scanLinks.start()
+    watchdog.start()
+    try:
+        await metrics.startMetricsServer()
+    except OSError as e:
+        print('Could not start the metrics server on port {0}: {1}'.format(metrics.metricsPort, e))
+
+#Rechecks every meme link in the background
+@tasks.loop(hours=checkIntervalHours)
+async def scanLinks():
+    dead = await linkChecker.scan(memeIndex.links.values())
+    print('Link scan finished. {0} of {1} memes are dead.'.format(dead, len(memeIndex)))
+
+@scanLinks.before_loop
+async def before_scanLinks():
+    await client.wait_until_ready()
 
 #---------------- Helper functions ----------------
 # Cleans special characters off of a string. Returns string without any special charactes
@@ -92,22 +166,17 @@ async def has_role(member, role_name) -> bool:
     role = discord.utils.get(member.roles, name=role_name)
     return role is not None
 
-async def getRowCount(tableName: str) -> int:
-    statement = "SELECT COUNT(*) FROM {}".format(tableName)
-    with Session(engine) as session:
-        result = session.execute(statement).fetchone()
-    return result[0]
-
-async def pickRandomRow(tableName: str, columnName: str) -> str:
-    totalRows = await getRowCount(tableName)
-    randomLine = random.randint(1,totalRows)
-    statement = "SELECT {} FROM {} WHERE id={};".format(columnName, tableName, randomLine)
-    with Session(engine) as session:
-        result = session.execute(statement).fetchone()
-    return result[0]
-
-async def createEmbedFromRandomLine(name: str, icon: str, tableName: str, columnName: str) -> str:
-    line = await pickRandomRow(tableName, columnName)
+# Checks if the user is a mod or bot mod
+#* Returns Boolean
+async def isMod(member) -> bool:
+    return await has_role(member=member, role_name=mod_name) or await has_role(member=member, role_name=bot_mod_name)
+
+#Random quote pickers. Shuffle bags so nobody sees the same quote twice until the whole table has gone by.
+rossQuotes = RandomPicker(QuoteRepository('bobQuotes'), shuffleBag=True)
+bovontoPitches = RandomPicker(QuoteRepository('bovontoPitches'), shuffleBag=True)
+
+async def createEmbedFromRandomLine(name: str, icon: str, picker: RandomPicker) -> str:
+    line = await picker.pick()
     e = discord.Embed(description=line)
     e.set_author(name=name, icon_url=icon)
     return e
@@ -118,65 +187,120 @@ async def rename_to(member):
 # ---------------- Meme Management ----------------
 #Message Send with !bb arg
 @client.hybrid_command(brief='Send a meme', description='Retrieves a stored meme from my necroborgic memories')
+@throttle()
 async def bb(ctx, meme: str):
-    with Session(engine) as session:
-        session.begin()        
-        search = meme.lower()
-        lookupString = "SELECT link FROM posts WHERE post_name LIKE '%{}%';".format(search)
-        try:
-            response = session.execute(text(lookupString)).fetchone()
-        except:
-            print('Failed to query posts for {}'.format(search))
-        
-        if response is None:
-            await ctx.send("Sorry, this command doesn't exist.")
+    response = memeIndex.lookup(meme)
+    if response is None:
+        suggestions = memeIndex.suggest(meme)
+        if suggestions:
+            await ctx.send("Sorry, this command doesn't exist. Did you mean: {}?".format(', '.join(suggestions)))
         else:
-            link = await cleanString(str(response[0]))
-            await ctx.send(link)
+            await ctx.send("Sorry, this command doesn't exist.")
+    else:
+        link = await cleanString(str(response))
+        if linkChecker.isDead(response):
+            link += "\n*(this one looks dead, sorry)*"
+        await ctx.send(link)
+
+#Suggests meme names as the user types. Discord calls this on every keystroke, so it only ever reads the in-memory index.
+@bb.autocomplete('meme')
+async def bb_autocomplete(interaction: discord.Interaction, current: str):
+    return [app_commands.Choice(name=name[:100], value=name[:100]) for name in memeIndex.search(current, 25)]
 
 #Mods can add items to the list
 @client.hybrid_command(brief='Add a meme', description='Adds a meme to my necroborgic memories, if you have permission')
 async def add(ctx, name: str, url: str):
-    if await has_role(member=ctx.message.author, role_name=mod_name) or await has_role(member=ctx.message.author, role_name=bot_mod_name):
-        with Session(engine) as session:
-            session.begin()
-            lookupString = "INSERT INTO posts (post_name, link) VALUES ('{0}','{1}');".format(name, url)
-            session.execute(text(lookupString))
-            session.commit()
-            await ctx.send("{} has been added to my necroborgic memories".format(name))
+    if await isMod(ctx.message.author):
+        if name.lower() in memeIndex.links:
+            await ctx.send("{} is already in my necroborgic memories".format(name))
+            return
+        try:
+            await memes.add(name, url)
+        except IntegrityError:
+            # taken in the db but not in the index, e.g. by a command line import since the bot started
+            await ctx.send("{} is already in my necroborgic memories".format(name))
+            return
+        memeIndex.add(name, url)
+        await ctx.send("{} has been added to my necroborgic memories".format(name))
     else:
         await ctx.send(unapprovedDeny.format(ctx.message.author))
 
 #Mods can remove items from the list
 @client.hybrid_command(brief='Remove a meme', description='Removes a meme from my necroborgic memories, if you have permission')
 async def remove (ctx, meme: str): 
-    if await has_role(member=ctx.message.author, role_name=mod_name) or await has_role(member=ctx.message.author, role_name=bot_mod_name):
-        with Session(engine) as session:
-            session.begin()
-            lookupString = "DELETE FROM posts WHERE post_name LIKE '%{}%';".format(meme)
-            session.execute(text(lookupString))
-            session.commit()
-            await ctx.send("{} has been purged from my necroborgic memories".format(meme))
+    if await isMod(ctx.message.author):
+        await memes.removeContaining(meme)
+        memeIndex.removeMatching(meme)
+        await ctx.send("{} has been purged from my necroborgic memories".format(meme))
     else:
         await ctx.send(unapprovedDeny.format(ctx.message.author))
 
-#Lists all meme commands
-@client.hybrid_command(brief='List all memes', description='Lists all memes stored in my necroborgic memories')
-async def beanfo(ctx):
-    #Cleans up returned values from databases
-    def listToString(s):
-        str1 = " "
-        return (str1.join(s).replace(" ", ", "))
+#Mods can load a whole file of memes at once
+@client.hybrid_command(brief='Import memes', description='Adds every meme in a .csv, .json or .jsonl file of names and links to my necroborgic memories, if you have permission')
+async def importmemes(ctx, file: discord.Attachment):
+    if await isMod(ctx.message.author):
+        try:
+            fileFormat = meme_io.formatFor(file.filename)
+            contents = (await file.read()).decode('utf-8-sig')
+            added = await database.runInExecutor(meme_io.importMemes, meme_io.readMemes(io.StringIO(contents, newline=''), fileFormat))
+        except (ValueError, KeyError, IndexError, TypeError, csv.Error) as e:
+            await ctx.send("I couldn't read that file: {}".format(e))
+            return
+        for name, link in added:
+            memeIndex.add(name, link)
+        await ctx.send("{} memes have been added to my necroborgic memories".format(len(added)))
+    else:
+        await ctx.send(unapprovedDeny.format(ctx.message.author))
+
+#Sends every meme back as a file, in the same formats importmemes takes
+@client.hybrid_command(brief='Export memes', description='Sends a file of every meme in my necroborgic memories')
+async def exportmemes(ctx, format: str = 'csv'):
+    try:
+        fileFormat = meme_io.formatFor('memes.' + format)
+    except ValueError as e:
+        await ctx.send(str(e))
+        return
+    contents = await database.runInExecutor(meme_io.exportMemesToBytes, fileFormat)
+    await ctx.send(file=discord.File(io.BytesIO(contents), filename='memes.' + fileFormat))
+
+#Flips through the meme list a page at a time
+class BeanfoView(discord.ui.View):
+    def __init__(self, pages: list):
+        super().__init__()
+        self.pages = pages
+        self.page = 0
+        self.update_buttons()
+
+    def update_buttons(self):
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page == len(self.pages) - 1
+
+    def content(self) -> str:
+        return '{0}\n\n*Page {1}/{2}*'.format(self.pages[self.page], self.page + 1, len(self.pages))
 
-    with Session(engine) as session:
-        session.begin()
-        info = session.execute(text('SELECT post_name FROM posts;'))
-        
-        finalList = []
-        for i in info:
-            finalList.append(i[0].replace("'",''))
+    async def show(self, interaction: discord.Interaction):
+        self.update_buttons()
+        await interaction.response.edit_message(content=self.content(), view=self)
 
-        await ctx.send(listToString(finalList))
+    @discord.ui.button(label='Previous', style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page -= 1
+        await self.show(interaction)
+
+    @discord.ui.button(label='Next', style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page += 1
+        await self.show(interaction)
+
+#Lists all meme commands, a page at a time. The pages are cached by the meme index until memes change.
+@client.hybrid_command(brief='List all memes', description='Lists all memes stored in my necroborgic memories')
+async def beanfo(ctx):
+    pages = memeIndex.pages()
+    if len(pages) == 1:
+        await ctx.send(pages[0] or 'My necroborgic memories are empty.')
+    else:
+        view = BeanfoView(pages)
+        await ctx.send(view.content(), view=view)
 
 
 # ---------------- New Member Welcome ----------------
@@ -189,7 +313,7 @@ async def on_raw_reaction_add(payload):
         emoji = payload.emoji.name 
         if emoji in role_emojis:
             role_name = role_emojis[emoji]
-            role = discord.utils.get(guild.roles, name=role_name)
+            role = roleIndex.get(guild, role_name)
 
             if role: 
                 await member.add_roles(role)
@@ -204,22 +328,62 @@ async def on_raw_reaction_remove(payload):
         emoji = payload.emoji.name 
         if emoji in role_emojis:
             role_name = role_emojis[emoji]
-            role = discord.utils.get(guild.roles, name=role_name)
+            role = roleIndex.get(guild, role_name)
 
             if role and role in member.roles: 
                 await member.remove_roles(role)
                 print(f"{member.name} has removed the {role_name} role.")               
 
-#Welcomes a new member
+#Builds the welcome embed, greeting whoever is mentioned
+def welcomeEmbed(mentions: str = None) -> discord.Embed:
+    if mentions:
+        embed = discord.Embed(description=f"Greetings {mentions}!\n\n{greetMessage}")
+    else:
+        embed = discord.Embed(description=f"{greetMessage}")
+    embed.set_author(name='Timey', icon_url=timeyIcon)
+    return embed
+
+#Greets a group of new members with as few messages as will fit them, then seeds reactions once
+async def greetMembers(guild, members):
+    if guild.system_channel is not None:
+        # embed descriptions max out at 4096 characters
+        room = 4096 - len(greetMessage) - len("Greetings !\n\n")
+        for mentions in mentionChunks(members, room):
+            message = await guild.system_channel.send(embed=welcomeEmbed(mentions))
+        reactionSeeder.enqueue(message)
+
+joinBatcher = JoinBatcher(greetMembers)
+
+#Keeps the role lookup tables in step with the server's roles
+@client.event
+async def on_guild_role_create(role):
+    roleIndex.build(role.guild)
+
+@client.event
+async def on_guild_role_update(before, after):
+    roleIndex.build(after.guild)
+
+@client.event
+async def on_guild_role_delete(role):
+    roleIndex.build(role.guild)
+
+#Which pronoun roles we can assign depends on our own top role, so rebuild when ours change
+@client.event
+async def on_member_update(before, after):
+    if after.id == client.user.id and before.roles != after.roles:
+        roleIndex.build(after.guild)
+
+@client.event
+async def on_guild_remove(guild):
+    roleIndex.forget(guild)
+
+#Welcomes a new member. With WELCOME_BATCH_SECONDS set, everyone joining within that window gets one shared welcome.
 @client.event
 async def on_member_join(member):
-    guild = member.guild
-    if guild.system_channel is not None:
-        embed = discord.Embed(description=f"Greetings {member.mention}!\n\n{greetMessage}")
-        embed.set_author(name='Timey', icon_url=timeyIcon)
-        message = await guild.system_channel.send(embed=embed)
-        for emoji in emojis:
-            await message.add_reaction(emoji)
+    if joinBatcher.window > 0:
+        joinBatcher.add(member)
+    else:
+        await greetMembers(member.guild, [member])
 
 #If needed, will resend the welcome message
 @client.hybrid_command(brief='Resend welcome message', description='Sends my welcome message again, in case a new member missed it')
@@ -228,53 +392,78 @@ async def welcome(ctx, member: discord.Member=None):
         guild =  ctx.guild 
         members = guild.members
         if member in members:
-            embed = discord.Embed(description=f"Greetings {member.mention}!\n\n{greetMessage}")
-            embed.set_author(name='Timey', icon_url=timeyIcon)
-            message = await ctx.send(embed=embed)
-            for emoji in emojis:
-                await message.add_reaction(emoji)
+            message = await ctx.send(embed=welcomeEmbed(member.mention))
+            await reactionSeeder.seed(message)
     else:
-        embed = discord.Embed(description=f"{greetMessage}")
-        embed.set_author(name='Timey', icon_url=timeyIcon)
-        message = await ctx.send(embed=embed)
-        for emoji in emojis:
-            await message.add_reaction(emoji)
+        message = await ctx.send(embed=welcomeEmbed())
+        await reactionSeeder.seed(message)
+
+#Link rewrite rules live in the link_rewrites table. They're loaded at startup and mods can reload them with /reloadlinks.
+linkRules = LinkRules([])
+linkGate = LinkGate()
+metrics.Callback('butterbean_messages_seen_total', 'Messages checked for links to rewrite', lambda: linkGate.seen, kind='counter')
+metrics.Callback('butterbean_messages_skipped_total', 'Messages skipped without a rewrite lookup', lambda: linkGate.skipped, kind='counter')
+metrics.Callback('butterbean_messages_rewritten_total', 'Messages that got a rewritten link reply', lambda: linkGate.rewritten, kind='counter')
 
 @client.event
 async def on_message(message):
-    #Hardcoding because I'm bad at my job. 
-    domains = {"x.com":"fixupx.com", "instagram.com":"ddinstagram.com", "tiktok.com":"vxtiktok.com"}
     #Check if message author is the bot to avoid a loop
     member = message.author
     if member == client.user:
         return
-    for domain in domains:
-        if "https://"+domain in message.content:
-            channel = message.channel
-            original_message = await channel.fetch_message(message.id)
-            await original_message.edit(suppress=True)
-            regex_pattern = re.compile(rf"https?://(?:www\.)?({domain})(.+)")
-            matches = regex_pattern.findall(message.content)
-            for match in matches:
-                new_content = message.content.replace(match[0], f"{domains[domain]}")
-                await channel.send(f"{new_content}")
+    #Most messages have no links at all, so bail before doing any real work
+    if not linkGate.check(message.content, message.channel.id):
+        return
+    #One reply per message, carrying every rewritten link
+    #A single link too long for a message leaves nothing to send, so the original is left alone
+    reply = linksMessage(linkRules.forChannel(message.channel.id).rewrittenLinks(message.content))
+    if reply:
+        linkGate.rewritten += 1
+        await message.edit(suppress=True)
+        await message.reply(reply, mention_author=False)
  
 
 
 
+#Mods can reload the link rewrite rules after editing the link_rewrites table
+@client.hybrid_command(brief='Reload link rewrites', description='Reloads the link rewrite rules from my necroborgic memories, if you have permission')
+async def reloadlinks(ctx):
+    global linkRules
+    if await isMod(ctx.message.author):
+        linkRules = await loadLinkRules()
+        await ctx.send("Reloaded {} link rewrite rules.".format(linkRules.count))
+    else:
+        await ctx.send(unapprovedDeny.format(ctx.message.author))
+
+#Mods can see how the event loop is holding up
+@client.hybrid_command(brief='Event loop health', description='Shows event loop lag and anything that has recently blocked it, if you have permission')
+async def loophealth(ctx):
+    if await isMod(ctx.message.author):
+        lines = ['Gateway latency: {:.0f}ms'.format(client.latency * 1000),
+                 'Loop lag: {0:.1f}ms average, {1:.1f}ms worst'.format(watchdog.averageLag() * 1000, watchdog.maxLag * 1000),
+                 'Stalls over {0:.0f}ms: {1}'.format(watchdog.threshold * 1000, watchdog.stallCount)]
+        for stall in watchdog.recentStalls():
+            duration = 'ongoing' if stall.duration is None else '{:.0f}ms'.format(stall.duration * 1000)
+            lines.append('<t:{0:.0f}:R> {1} in `{2}` at `{3}`'.format(stall.detectedAt, duration, stall.task, stall.location))
+        await ctx.send('\n'.join(lines), ephemeral=True)
+    else:
+        await ctx.send(unapprovedDeny.format(ctx.message.author))
+
 # ---------------- Sending random messages ----------------
 #Bob Ross quote
 @client.hybrid_command(brief='Quote Bob Ross', description='Sends a Bob Ross quote')
+@throttle()
 async def bobross(ctx):
 # Posts quotes of Bob Ross
     embedRossIcon = "http://i.imgur.com/OZLdaSn.png"
-    await ctx.send(embed=await createEmbedFromRandomLine(name='Bob Ross',icon=embedRossIcon, tableName='bobQuotes', columnName='quote'))
+    await ctx.send(embed=await createEmbedFromRandomLine(name='Bob Ross',icon=embedRossIcon, picker=rossQuotes))
 
 #Just sends a damn Bovonto pitch
 @client.hybrid_command(brief='Pitch Bovonto', description='Sends a Bovonto advertising pitch')
+@throttle()
 async def bovonto(ctx):
     embedBovontoIcon = 'https://imgur.com/8aCQlV5.png'
-    await ctx.send(embed=await createEmbedFromRandomLine(name='Bovonto Bot',icon=embedBovontoIcon, tableName='bovontoPitches', columnName='pitch'))
+    await ctx.send(embed=await createEmbedFromRandomLine(name='Bovonto Bot',icon=embedBovontoIcon, picker=bovontoPitches))
 
 #Adds a non-pronoun specific role
 @client.hybrid_command(brief='Add other opt-in role', description='Join one of the other role-based groups')
@@ -316,22 +505,31 @@ async def create_ticket(ctx, title: str, body: str):
 #---------------- Tarot functions ----------------
 # single card draw
 @client.hybrid_command(brief='Single card tarot draw', help='Draws a random card from a 78 card Rider-Waite tarot deck, including reversed cards.')
+@throttle()
 async def tarot(ctx):
-    if '__template' in tarotData:
+    deck = loadDeck()
+    if deck.isTemplate:
         await ctx.send('Oops, someone needs to put a proper tarot deck into my brain first!')
     else:
-        if 'deck' in tarotData:
-            card_index = random.randint(0, len(tarotData['deck'])-1)
-            card = tarotData['deck'][card_index]
-            emb = discord.Embed(type='rich', title=card['title'], description=card['meaning'], url=card['url'])
-            emb.add_field(name='Keywords', value=', '.join(card['keywords']) )
-            emb.add_field(name='Yes/No?', value=card['yesno'])
-            emb.set_image(url=card['image'])
-            emb.set_footer(text='Images © Labyrinthos LLC')
+        if deck.embeds:
+            emb = deck.randomEmbed()
             await ctx.send('{0.display_name}, you have drawn: '.format(ctx.message.author), embed=emb)
         else:
             await ctx.send('Oops, I do not seem to have a valid tarot deck loaded, sorry!')
 
+# multi card spread, sent as one message. Discord allows up to 10 embeds per message, which is exactly a Celtic Cross.
+@client.hybrid_command(brief='Multi card tarot spread', help='Draws several different cards from a 78 card Rider-Waite tarot deck, including reversed cards, in a single reading.')
+@throttle()
+async def spread(ctx, cards: commands.Range[int, 1, 10] = 3):
+    deck = loadDeck()
+    if deck.isTemplate:
+        await ctx.send('Oops, someone needs to put a proper tarot deck into my brain first!')
+    elif deck.embeds:
+        embeds = deck.drawSpread(cards)
+        await ctx.send('{0.display_name}, your spread is: '.format(ctx.message.author), embeds=embeds)
+    else:
+        await ctx.send('Oops, I do not seem to have a valid tarot deck loaded, sorry!')
+
 #----- Pronoun Picker -----
 
 # our pronoun picker feature needs a "view" to be able to display some UI components; this one just inherits straight from
@@ -349,7 +547,7 @@ class PronounPicker(discord.ui.Select):
     def __init__(self, interaction: discord.Interaction):
 
         # get all the settable roles that look like pronouns
-        valid_pronouns = list(filter(lambda r: r.is_assignable() and (r.name.find('/') > -1) and (not r.name in restricted_roles), reversed(interaction.guild.roles)))
+        valid_pronouns = roleIndex.pronouns(interaction.guild)
 
         # Set the options that will be presented inside the dropdown
         options = []
@@ -368,23 +566,24 @@ class PronounPicker(discord.ui.Select):
     # when the user finishes making their selection, this callback fires
     async def callback(self, interaction: discord.Interaction):
 
+        # editing roles can take a moment, so acknowledge the interaction before Discord's 3 second deadline
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         # get all the settable roles that look like pronouns
-        valid_pronouns = list(filter(lambda r: r.is_assignable() and (r.name.find('/') > -1) and (not r.name in restricted_roles), reversed(interaction.guild.roles)))
+        valid_pronouns = roleIndex.pronouns(interaction.guild)
 
-        # check whether we need to set and/or unset each pronoun
-        for p in valid_pronouns:
-            if p.name in self.values:
-                # this pronoun is in the list of wanted pronouns, add it if necessary
-                if not (p in interaction.user.roles):
-                    await interaction.user.add_roles(p, reason=f'Added by {interaction.user.name} via pronoun picker')
-            else:
-                # this pronoun is not wanted, remove it if necessary
-                if (p in interaction.user.roles):
-                    await interaction.user.remove_roles(p, reason=f'Removed by {interaction.user.name} via pronoun picker')
+        # work out the user's full role list with the pronouns swapped for the chosen ones, leaving every other role alone
+        #   (@everyone can't be sent back to the API, so it's left out)
+        wanted = [p for p in valid_pronouns if p.name in self.values]
+        current = [r for r in interaction.user.roles if not r.is_default()]
+        new_roles = [r for r in current if r not in valid_pronouns] + wanted
 
-        # show confirmation to the user (that only the user can see)
-        await interaction.response.send_message(f'Your pronouns are now {", ".join(self.values) if len(self.values) > 0 else "(none)"}', ephemeral=True)
+        # and apply the whole change in one request, if there is one
+        if set(new_roles) != set(current):
+            await interaction.user.edit(roles=new_roles, reason=f'Changed by {interaction.user.name} via pronoun picker')
 
+        # show confirmation to the user (that only the user can see)
+        await interaction.followup.send(f'Your pronouns are now {", ".join(self.values) if len(self.values) > 0 else "(none)"}', ephemeral=True)
 
 # add the slash command to the bot's command tree
 @client.tree.command(description='Get a menu to pick your pronouns from')
@@ -0,0 +1,68 @@
+#Database access for the bot. Every query runs on a small dedicated thread pool so the gateway loop never blocks on SQLite.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from modules import db_config
+from modules.metrics import dbQueryDuration
+
+engine = db_config.configureEngine(create_engine(
+    db_config.databaseUrl,
+    future=True,
+    poolclass=QueuePool,
+    pool_size=db_config.poolSize,
+    max_overflow=0,
+    query_cache_size=db_config.compiledCacheSize,
+    # connections are handed between worker threads by the pool. sqlite3 keeps its own prepared statements per connection.
+    connect_args={'check_same_thread': False, 'cached_statements': db_config.preparedStatementCacheSize},
+))
+
+executor = ThreadPoolExecutor(max_workers=db_config.poolSize, thread_name_prefix='butterbean-db')
+
+# Runs a blocking function on the db executor and awaits the result
+async def runInExecutor(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+# The same TextClause for the same SQL every time, so SQLAlchemy's compiled cache gets hits instead of re-parsing.
+#  Statements that are already built, like the ones in modules/repositories.py, pass straight through.
+def statementFor(statement):
+    return textFor(statement) if isinstance(statement, str) else statement
+
+@lru_cache(maxsize=256)
+def textFor(statement: str):
+    return text(statement)
+
+def _fetchOne(statement, params: dict):
+    with Session(engine) as session:
+        return session.execute(statementFor(statement), params).fetchone()
+
+def _fetchAll(statement, params: dict) -> list:
+    with Session(engine) as session:
+        return session.execute(statementFor(statement), params).fetchall()
+
+def _execute(statement, params: dict) -> int:
+    with Session(engine) as session:
+        result = session.execute(statementFor(statement), params)
+        session.commit()
+        return result.rowcount
+
+# Returns the first row of a query, or None
+async def fetchOne(statement, params: dict = None):
+    with dbQueryDuration.time('fetchOne'):
+        return await runInExecutor(_fetchOne, statement, params or {})
+
+# Returns every row of a query
+async def fetchAll(statement, params: dict = None) -> list:
+    with dbQueryDuration.time('fetchAll'):
+        return await runInExecutor(_fetchAll, statement, params or {})
+
+# Runs a write and commits it
+#* Returns number of affected rows
+async def execute(statement, params: dict = None) -> int:
+    with dbQueryDuration.time('execute'):
+        return await runInExecutor(_execute, statement, params or {})
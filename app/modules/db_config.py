@@ -0,0 +1,56 @@
+#SQLite settings for the bot's engine. Everything can be overridden from the environment.
+import logging, os, time
+
+from sqlalchemy import event
+
+databaseUrl = os.environ.get('DB_URL', 'sqlite+pysqlite:///db/butterbean.db')
+#Number of db worker threads, which is also the size of the connection pool so a worker never waits on a connection
+poolSize = int(os.environ.get('DB_POOL_SIZE', '4'))
+#How many compiled statements SQLAlchemy keeps around for reuse
+compiledCacheSize = int(os.environ.get('DB_COMPILED_CACHE_SIZE', '500'))
+#How many prepared statements sqlite3 keeps per connection
+preparedStatementCacheSize = int(os.environ.get('DB_PREPARED_CACHE_SIZE', '256'))
+#Bytes of the db file to memory map, and the page cache size (negative means KiB, per SQLite)
+mmapSize = int(os.environ.get('DB_MMAP_SIZE', str(64 * 1024 * 1024)))
+cacheSize = int(os.environ.get('DB_CACHE_SIZE', '-16000'))
+#Set SQL_LOG=1 to log every statement with how long it took
+sqlLog = os.environ.get('SQL_LOG', '').lower() in ('1', 'true', 'yes')
+
+sqlLogger = logging.getLogger('butterbean.sql')
+
+#WAL lets reads carry on while something writes, and with WAL, synchronous=NORMAL is still safe against corruption
+pragmas = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA mmap_size={}'.format(mmapSize),
+    'PRAGMA cache_size={}'.format(cacheSize),
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA busy_timeout=5000',
+)
+
+def setPragmas(dbapiConnection, connectionRecord):
+    cursor = dbapiConnection.cursor()
+    for pragma in pragmas:
+        cursor.execute(pragma)
+    cursor.close()
+
+def startTimer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+def logStatement(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    sqlLogger.info('sql duration_ms=%.2f executemany=%s statement=%r', elapsed * 1000, executemany, ' '.join(statement.split()))
+
+#Hooks the pragmas, and the statement log if it's turned on, into an engine
+def configureEngine(engine):
+    event.listen(engine, 'connect', setPragmas)
+    if sqlLog:
+        # client.run only sets up logging for discord's own loggers, so this one needs a handler of its own
+        if not sqlLogger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+            sqlLogger.addHandler(handler)
+        sqlLogger.setLevel(logging.INFO)
+        event.listen(engine, 'before_cursor_execute', startTimer)
+        event.listen(engine, 'after_cursor_execute', logStatement)
+    return engine
@@ -0,0 +1,85 @@
+#Checks meme links in the background so /bb can warn about ones that have died (looking at you, imgur)
+import asyncio, os, time
+from urllib.parse import urlparse
+
+import aiohttp
+
+from modules import database
+
+#How many requests can be open at once, overall and to any one host
+checkConcurrency = int(os.environ.get('LINK_CHECK_CONCURRENCY', '20'))
+checkPerHost = int(os.environ.get('LINK_CHECK_PER_HOST', '4'))
+#Hours between scans of the whole meme library
+checkIntervalHours = float(os.environ.get('LINK_CHECK_HOURS', '24'))
+
+#Status recorded when a link couldn't be reached at all
+unreachable = 0
+
+#Imgur doesn't 404 deleted images, it redirects them to a placeholder
+def isRemovedPlaceholder(url) -> bool:
+    return 'removed.png' in str(url)
+
+#Checks one link, with a HEAD request where the host allows it
+#* Returns (status, alive). alive is None if the link couldn't be reached, since a timeout or a dropped connection
+#  says nothing about whether the meme is still there.
+async def checkLink(session: aiohttp.ClientSession, link: str, timeout: aiohttp.ClientTimeout = None) -> tuple:
+    try:
+        async with session.head(link, allow_redirects=True, timeout=timeout) as response:
+            status, url = response.status, response.url
+        # some hosts don't do HEAD, so ask again properly without reading the body
+        if status in (403, 405, 501):
+            async with session.get(link, allow_redirects=True, timeout=timeout) as response:
+                status, url = response.status, response.url
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return unreachable, None
+    return status, status < 400 and not isRemovedPlaceholder(url)
+
+#Checks a batch of links concurrently over one pooled session. Pass a session to point it somewhere else, e.g. a stub server.
+#Concurrency is capped with semaphores rather than the connector's limits, so a link's timeout only starts once it has a
+#  slot. Otherwise links queued behind a busy host (most of ours are on imgur) time out before they're ever sent.
+#* Returns dict of link -> (status, alive)
+async def checkLinks(links, session: aiohttp.ClientSession = None, timeout: float = 10,
+                     concurrency: int = checkConcurrency, perHost: int = checkPerHost) -> dict:
+    if session is None:
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+            return await checkLinks(links, session, timeout, concurrency, perHost)
+    links = list(dict.fromkeys(links))
+    requestTimeout = aiohttp.ClientTimeout(total=timeout)
+    overall = asyncio.Semaphore(concurrency)
+    hosts = {}
+
+    async def check(link: str) -> tuple:
+        host = hosts.setdefault(urlparse(link).hostname, asyncio.Semaphore(perHost))
+        async with host, overall:
+            return await checkLink(session, link, requestTimeout)
+
+    results = await asyncio.gather(*(check(link) for link in links))
+    return dict(zip(links, results))
+
+#Keeps the set of known dead links in memory and refreshes it by scanning
+class LinkChecker:
+    def __init__(self):
+        self.dead = set()
+
+    async def load(self):
+        rows = await database.fetchAll('SELECT link FROM link_status WHERE alive = 0;')
+        self.dead = {row[0] for row in rows}
+
+    def isDead(self, link: str) -> bool:
+        return link in self.dead
+
+    #Checks every link and records the results
+    #* Returns number of dead links
+    async def scan(self, links, session: aiohttp.ClientSession = None) -> int:
+        results = await checkLinks(links, session)
+        now = time.time()
+        if not results:
+            return len(self.dead)
+        # links that couldn't be reached keep whatever state they had before
+        results = {link: (status, link not in self.dead if alive is None else alive) for link, (status, alive) in results.items()}
+        await database.execute(
+            'INSERT OR REPLACE INTO link_status (link, status, alive, checked_at) VALUES (:link, :status, :alive, :checked);',
+            [{'link': link, 'status': status, 'alive': int(alive), 'checked': now} for link, (status, alive) in results.items()],
+        )
+        self.dead = (self.dead - results.keys()) | {link for link, (status, alive) in results.items() if not alive}
+        return len(self.dead)
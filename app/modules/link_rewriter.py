@@ -0,0 +1,117 @@
+#Rewrites social media links to their embed-friendly proxies, in one pass over the message
+import os, re
+
+from modules import database
+
+#Brackets a link can end in, and the one that has to be open inside the link for the closer to belong to it
+closers = {')': '(', ']': '['}
+
+#Drops sentence punctuation off the end of a link, and any closing bracket it was wrapped in.
+#  Anything else stays, since a url can really end in _ or ~ (x.com/jack_ is someone else entirely from x.com/jack).
+#* Returns url
+def trimLink(link: str) -> str:
+    while link:
+        last = link[-1]
+        if last in '.,!?;:':
+            link = link[:-1]
+        elif last in closers and link.count(closers[last]) < link.count(last):
+            link = link[:-1]
+        else:
+            break
+    return link
+
+#Markdown that can sit right up against a link and is also allowed inside urls, so it's only dropped as a matching pair
+emphasis = re.compile(r"[*_~]+$")
+
+class LinkRewriter:
+    # rules: source host -> replacement host, e.g. {"x.com": "fixupx.com"}
+    def __init__(self, rules: dict):
+        self.rules = {source.lower(): target for source, target in rules.items()}
+        self.pattern = None
+        if self.rules:
+            # longest hosts first so one host that ends another can't steal its match
+            hosts = '|'.join(re.escape(host) for host in sorted(self.rules, key=len, reverse=True))
+            # the host has to end there, so x.com doesn't match x.community, but a full stop after it is fine.
+            #  | ` < and > can't appear in a url, so they always end the link, which keeps spoiler and code markdown out of it.
+            self.pattern = re.compile(rf"(https?://)(?:www\.)?({hosts})(?![\w-]|\.\w)([^\s|`<>]*)", re.IGNORECASE)
+
+    def replaceHost(self, match) -> str:
+        return match.group(1) + self.rules[match.group(2).lower()] + match.group(3)
+
+    #Finds every matching link and rewrites it, dropping repeats and any punctuation or bold/italic markdown the link was
+    #  wrapped in. Spoilered links come back spoilered and <suppressed> ones stay suppressed. Links in code are left alone,
+    #  since Discord doesn't embed those anyway.
+    #* Returns list of rewritten urls, ready to send, in the order they appeared
+    def rewrittenLinks(self, content: str) -> list:
+        if self.pattern is None:
+            return []
+        links = []
+        for match in self.pattern.finditer(content):
+            before = content[:match.start()]
+            if before.count('`') % 2:
+                continue
+            link = trimLink(self.replaceHost(match))
+            wrapper = emphasis.search(before)
+            if wrapper and link.endswith(wrapper.group()[::-1]):
+                link = trimLink(link[:-len(wrapper.group())])
+            if before.endswith('<') and content[match.end():].startswith('>'):
+                link = '<' + link + '>'
+            if before.count('||') % 2:
+                link = '||' + link + '||'
+            if link not in links:
+                links.append(link)
+        return links
+
+#Joins links into one message, leaving off any that would push it past Discord's 2000 character limit
+def linksMessage(links: list, limit: int = 2000) -> str:
+    message = ''
+    for link in links:
+        line = link if not message else '\n' + link
+        if len(message) + len(line) > limit:
+            break
+        message += line
+    return message
+
+#Channels where links are never rewritten, as a comma separated list of channel ids
+optOutChannels = frozenset(int(c) for c in os.environ.get('LINK_REWRITE_OPTOUT_CHANNELS', '').split(',') if c.strip())
+
+#Cheap first check so messages without links never reach the rewriter, with counts of what it let through
+class LinkGate:
+    def __init__(self, optOut: frozenset = optOutChannels):
+        self.optOut = optOut
+        self.seen = 0
+        self.skipped = 0
+        self.rewritten = 0
+
+    #* Returns True if the message could have a link worth rewriting
+    def check(self, content: str, channelId: int) -> bool:
+        self.seen += 1
+        if "://" not in content or channelId in self.optOut:
+            self.skipped += 1
+            return False
+        return True
+
+#The rewrite rules from the link_rewrites table, compiled into a rewriter for everywhere plus one per channel that has its own rules
+class LinkRules:
+    # rows of (source_host, target_host, channel_id). A channel_id of None applies everywhere.
+    def __init__(self, rows: list):
+        globalRules = {}
+        channelRules = {}
+        for source, target, channel in rows:
+            if channel is None:
+                globalRules[source.lower()] = target
+            else:
+                channelRules.setdefault(channel, {})[source.lower()] = target
+        self.count = len(rows)
+        self.everywhere = LinkRewriter(globalRules)
+        # a channel's own rule for a host beats the server-wide one
+        self.channels = {channel: LinkRewriter({**globalRules, **rules}) for channel, rules in channelRules.items()}
+
+    def forChannel(self, channelId: int) -> LinkRewriter:
+        return self.channels.get(channelId, self.everywhere)
+
+#Reads the enabled rules from the db. The table and its default rules come from the migrations.
+#* Returns LinkRules
+async def loadLinkRules() -> LinkRules:
+    rows = await database.fetchAll('SELECT source_host, target_host, channel_id FROM link_rewrites WHERE enabled = 1 ORDER BY id;')
+    return LinkRules(rows)
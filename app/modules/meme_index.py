@@ -0,0 +1,214 @@
+#In-memory index of the posts table so /bb and its autocomplete never have to touch the database
+
+#Splits a name into overlapping three letter chunks, padded so the start and end of the name count too
+#* Returns set of strings
+def trigrams(name: str) -> set:
+    padded = '  ' + name + ' '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class TrieNode:
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self):
+        self.children = {}
+        self.terminal = False
+
+#Prefix tree of names, for prefix lookups that stop as soon as they have enough results
+class PrefixTrie:
+    def __init__(self):
+        self.root = TrieNode()
+
+    def insert(self, name: str):
+        node = self.root
+        for char in name:
+            node = node.children.setdefault(char, TrieNode())
+        node.terminal = True
+
+    def remove(self, name: str):
+        path = [self.root]
+        for char in name:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].terminal = False
+        # prune the branch back up to the last node something else still needs
+        for i in range(len(name), 0, -1):
+            node = path[i]
+            if node.terminal or node.children:
+                break
+            del path[i - 1].children[name[i - 1]]
+
+    #Names starting with prefix, in alphabetical order
+    #* Returns list of names
+    def withPrefix(self, prefix: str, limit: int = None) -> list:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        results = []
+        # depth first, pushing children in reverse so they pop off in order
+        stack = [(node, prefix)]
+        while stack:
+            node, name = stack.pop()
+            if node.terminal:
+                results.append(name)
+                if limit is not None and len(results) >= limit:
+                    break
+            for char in sorted(node.children, reverse=True):
+                stack.append((node.children[char], name + char))
+        return results
+
+class MemeIndex:
+    # fuzzy matches scoring below this (shared trigrams over all trigrams) aren't worth suggesting
+    minSimilarity = 0.3
+
+    def __init__(self):
+        # lowercased post_name -> link, kept in table order so substring lookups match what LIKE used to return
+        self.links = {}
+        # lowercased names for prefix lookups
+        self.trie = PrefixTrie()
+        # trigram -> names containing it, and name -> how many trigrams it has, for fuzzy matching
+        self.grams = {}
+        self.gramCounts = {}
+        # bumped on every change, so anything built from the index knows when it's stale
+        self.version = 0
+        self.cachedPages = None
+
+    #Replaces the whole index with rows of (post_name, link)
+    def load(self, rows):
+        self.links = {}
+        self.trie = PrefixTrie()
+        self.grams = {}
+        self.gramCounts = {}
+        self.version += 1
+        for name, link in rows:
+            # the first row wins for duplicate names, same as fetchone() did
+            key = name.lower()
+            if key not in self.links:
+                self.links[key] = link
+                self.trie.insert(key)
+                self.indexGrams(key)
+
+    def indexGrams(self, name: str):
+        grams = trigrams(name)
+        self.gramCounts[name] = len(grams)
+        for gram in grams:
+            self.grams.setdefault(gram, set()).add(name)
+
+    def unindexGrams(self, name: str):
+        del self.gramCounts[name]
+        for gram in trigrams(name):
+            names = self.grams[gram]
+            names.discard(name)
+            if not names:
+                del self.grams[gram]
+
+    def add(self, name: str, link: str):
+        key = name.lower()
+        if key not in self.links:
+            self.version += 1
+            self.trie.insert(key)
+            self.links[key] = link
+            self.indexGrams(key)
+
+    #Removes every name containing the search term, mirroring remove's LIKE '%term%' delete
+    #* Returns list of removed names
+    def removeMatching(self, search: str) -> list:
+        search = search.lower()
+        removed = [name for name in self.links if search in name]
+        if removed:
+            self.version += 1
+        for name in removed:
+            del self.links[name]
+            self.trie.remove(name)
+            self.unindexGrams(name)
+        return removed
+
+    def withPrefix(self, prefix: str, limit: int = None) -> list:
+        return self.trie.withPrefix(prefix.lower(), limit)
+
+    #Names that share enough trigrams with the search term, most similar first
+    #* Returns list of names
+    def fuzzy(self, search: str, limit: int = 5) -> list:
+        searchGrams = trigrams(search.lower())
+        shared = {}
+        for gram in searchGrams:
+            for name in self.grams.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+        scored = []
+        for name, count in shared.items():
+            similarity = count / (len(searchGrams) + self.gramCounts[name] - count)
+            if similarity >= self.minSimilarity:
+                scored.append((-similarity, name))
+        scored.sort()
+        return [name for _, name in scored[:limit]]
+
+    #Every name that matches the search term: the exact name, then ones starting with it, then ones containing it,
+    #  then close misspellings
+    #* Returns list of names
+    def search(self, search: str, limit: int = 25) -> list:
+        search = search.lower()
+        results = [search] if search in self.links else []
+        for name in self.withPrefix(search, limit + 1):
+            if len(results) >= limit:
+                return results
+            if name != search:
+                results.append(name)
+        seen = set(results)
+        for name in self.links:
+            if len(results) >= limit:
+                return results
+            if search in name and name not in seen:
+                results.append(name)
+                seen.add(name)
+        for name in self.fuzzy(search, limit):
+            if len(results) >= limit:
+                break
+            if name not in seen:
+                results.append(name)
+        return results
+
+    #Finds a link for a search term: exact name, then first name starting with it, then first name containing it
+    #* Returns link or None
+    def lookup(self, search: str):
+        search = search.lower()
+        if search in self.links:
+            return self.links[search]
+        prefixed = self.withPrefix(search, 1)
+        if prefixed:
+            return self.links[prefixed[0]]
+        for name, link in self.links.items():
+            if search in name:
+                return link
+        return None
+
+    #Close misspellings of a search term that didn't match anything
+    #* Returns list of names
+    def suggest(self, search: str, limit: int = 3) -> list:
+        return self.fuzzy(search, limit)
+
+    #The meme list split into pages of comma separated names, each short enough for one message.
+    #  Built once and reused until the index changes.
+    #* Returns list of strings
+    def pages(self, limit: int = 1900) -> list:
+        if self.cachedPages is not None and self.cachedPages[0] == self.version:
+            return self.cachedPages[1]
+        pages = []
+        current = ''
+        for name in self.links:
+            name = name.replace("'", '')
+            entry = name if not current else ', ' + name
+            if current and len(current) + len(entry) > limit:
+                pages.append(current)
+                entry = name
+                current = ''
+            current += entry
+        if current or not pages:
+            pages.append(current)
+        self.cachedPages = (self.version, pages)
+        return pages
+
+    def __len__(self):
+        return len(self.links)
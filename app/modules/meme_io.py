@@ -0,0 +1,108 @@
+#Bulk meme import and export, as CSV or JSON.
+#From the app folder: python -m modules.meme_io import memes.csv | python -m modules.meme_io export memes.csv
+#The command line import writes straight to the db, behind the running bot's back. Restart the bot afterwards so /bb can
+#  find the new memes; /importmemes updates the bot as it goes.
+import csv, io, json, os, sys
+
+from sqlalchemy.orm import Session
+
+from modules import database
+from modules.repositories import MemeRepository
+
+#Works out the file format from its name
+#* Returns 'csv', 'json' or 'jsonl'
+def formatFor(filename: str) -> str:
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    if extension in ('csv', 'json', 'jsonl'):
+        return extension
+    raise ValueError('Unsupported meme file {}, expected .csv, .json or .jsonl'.format(filename))
+
+#Names and links as strings, whatever type the file gave them as. Anything that isn't an object or a [name, link] pair
+#  is refused, rather than being picked apart into nonsense like the first two letters of a string.
+def rowFromObject(item):
+    if isinstance(item, dict):
+        name, link = item.get('name', item.get('post_name')), item.get('link', item.get('url'))
+    elif isinstance(item, (list, tuple)) and len(item) >= 2:
+        name, link = item[0], item[1]
+    else:
+        raise ValueError('Expected a {{"name", "link"}} object or a [name, link] pair, got {}'.format(json.dumps(item)[:100]))
+    return None if name is None else str(name), None if link is None else str(link)
+
+#Reads (name, link) pairs from a text stream one at a time. CSV takes name,link rows with an optional header,
+#  JSON takes a list of {"name", "link"} objects or [name, link] pairs, and JSON Lines takes one of those per line.
+def readMemes(stream, fileFormat: str):
+    if fileFormat == 'csv':
+        for number, row in enumerate(csv.reader(stream)):
+            # only the first row can be a header, later ones are memes that happen to be called "name"
+            if len(row) < 2 or (number == 0 and row[0].strip().lower() in ('name', 'post_name')):
+                continue
+            yield row[0], row[1]
+    elif fileFormat == 'jsonl':
+        for line in stream:
+            if line.strip():
+                yield rowFromObject(json.loads(line))
+    else:
+        items = json.load(stream)
+        if not isinstance(items, list):
+            raise ValueError('Expected a JSON list of memes, got a {}'.format(type(items).__name__))
+        for item in items:
+            yield rowFromObject(item)
+
+#Inserts every meme whose name isn't taken yet, all in one transaction. Blocking, so the bot runs it on the db executor.
+#* Returns list of (name, link) that were added
+def importMemes(rows) -> list:
+    with Session(database.engine) as session:
+        taken = {name.lower() for name, in session.execute(MemeRepository.selectNames)}
+        added = []
+        for name, link in rows:
+            name, link = (name or '').strip(), (link or '').strip()
+            if name and link and name.lower() not in taken:
+                taken.add(name.lower())
+                added.append((name, link))
+        if added:
+            session.execute(MemeRepository.insert, [{'name': n, 'link': l} for n, l in added])
+        session.commit()
+    return added
+
+#Writes every meme to a text stream, reading them from the db in batches rather than all at once
+#* Returns number of memes written
+def exportMemes(stream, fileFormat: str) -> int:
+    count = 0
+    writer = csv.writer(stream) if fileFormat == 'csv' else None
+    if writer:
+        writer.writerow(['name', 'link'])
+    elif fileFormat == 'json':
+        stream.write('[')
+    with Session(database.engine) as session:
+        result = session.execute(MemeRepository.selectAll.execution_options(stream_results=True))
+        for batch in result.partitions(500):
+            for name, link in batch:
+                if writer:
+                    writer.writerow([name, link])
+                elif fileFormat == 'json':
+                    stream.write(('\n' if count == 0 else ',\n') + json.dumps({'name': name, 'link': link}, ensure_ascii=False))
+                else:
+                    stream.write(json.dumps({'name': name, 'link': link}, ensure_ascii=False) + '\n')
+                count += 1
+    if fileFormat == 'json':
+        stream.write('\n]\n')
+    return count
+
+#Exports into memory, for sending as an attachment
+#* Returns bytes
+def exportMemesToBytes(fileFormat: str) -> bytes:
+    stream = io.StringIO()
+    exportMemes(stream, fileFormat)
+    return stream.getvalue().encode('utf-8')
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] not in ('import', 'export'):
+        sys.exit('usage: python -m modules.meme_io import|export <file.csv|file.json|file.jsonl>')
+    command, filename = sys.argv[1], sys.argv[2]
+    if command == 'import':
+        with open(filename, newline='', encoding='utf-8') as f:
+            added = importMemes(readMemes(f, formatFor(filename)))
+        print('Imported {} memes'.format(len(added)))
+    else:
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            print('Exported {} memes'.format(exportMemes(f, formatFor(filename))))
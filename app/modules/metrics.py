@@ -0,0 +1,141 @@
+#Prometheus metrics, served over HTTP from the bot's own event loop
+import os, time
+
+from aiohttp import web
+
+#Port for the metrics server. 443 is what the chart and compose file already expose.
+metricsPort = int(os.environ.get('METRICS_PORT', '443'))
+
+registry = []
+
+def formatLabels(names: tuple, values: tuple, extra: str = '') -> str:
+    pairs = ['{0}="{1}"'.format(n, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def formatValue(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value != value:
+        return 'NaN'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        registry.append(self)
+
+    def header(self) -> list:
+        return ['# HELP {0} {1}'.format(self.name, self.help), '# TYPE {0} {1}'.format(self.name, self.kind)]
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        super().__init__(name, help, labels)
+        self.values = {}
+
+    def inc(self, *labelValues, amount: float = 1):
+        self.values[labelValues] = self.values.get(labelValues, 0) + amount
+
+    def render(self) -> list:
+        return self.header() + ['{0}{1} {2}'.format(self.name, formatLabels(self.labels, k), formatValue(v)) for k, v in self.values.items()]
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value: float, *labelValues):
+        self.values[labelValues] = value
+
+#A gauge or counter whose value is read from somewhere else when scraped
+class Callback(Metric):
+    def __init__(self, name: str, help: str, function, kind: str = 'gauge'):
+        super().__init__(name, help)
+        self.function = function
+        self.kind = kind
+
+    def render(self) -> list:
+        return self.header() + ['{0} {1}'.format(self.name, formatValue(self.function()))]
+
+class Histogram(Metric):
+    kind = 'histogram'
+    defaultBuckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = defaultBuckets):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+        # label values -> [per bucket counts, sum, count]
+        self.values = {}
+
+    def observe(self, value: float, *labelValues):
+        series = self.values.get(labelValues)
+        if series is None:
+            series = self.values[labelValues] = [[0] * len(self.buckets), 0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][i] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list:
+        lines = self.header()
+        for labelValues, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, bucketCount in zip(self.buckets, counts):
+                cumulative += bucketCount
+                lines.append('{0}_bucket{1} {2}'.format(self.name, formatLabels(self.labels, labelValues, 'le="{}"'.format(formatValue(bound))), cumulative))
+            lines.append('{0}_sum{1} {2}'.format(self.name, formatLabels(self.labels, labelValues), formatValue(total)))
+            lines.append('{0}_count{1} {2}'.format(self.name, formatLabels(self.labels, labelValues), count))
+        return lines
+
+    #Times the block inside it
+    def time(self, *labelValues):
+        return Timer(self, labelValues)
+
+class Timer:
+    __slots__ = ('histogram', 'labelValues', 'start')
+
+    def __init__(self, histogram: Histogram, labelValues: tuple):
+        self.histogram = histogram
+        self.labelValues = labelValues
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelValues)
+
+def render() -> str:
+    lines = []
+    for metric in registry:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+#---------------- The bot's metrics ----------------
+commandLatency = Histogram('butterbean_command_duration_seconds', 'Time from a command being invoked to it finishing', ('command', 'outcome'))
+dbQueryDuration = Histogram('butterbean_db_query_duration_seconds', 'Time a db call takes, including waiting for a worker', ('operation',))
+loopLag = Histogram('butterbean_event_loop_lag_seconds', 'How late the event loop ran a timer that should have fired on time',
+                    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5))
+loopLagLatest = Gauge('butterbean_event_loop_lag_latest_seconds', 'Most recent event loop lag sample')
+loopStalls = Counter('butterbean_event_loop_stalls_total', 'Times something held the event loop past the watchdog threshold')
+rateLimitHits = Counter('butterbean_rate_limit_hits_total', 'Command invocations turned away by the rate limiter', ('command', 'scope'))
+
+async def handleMetrics(request):
+    return web.Response(body=render().encode('utf-8'), headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'})
+
+#Starts serving /metrics on the running loop
+#* Returns the AppRunner, for cleanup
+async def startMetricsServer(port: int = metricsPort) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get('/metrics', handleMetrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '0.0.0.0', port).start()
+    return runner
@@ -0,0 +1,80 @@
+#Versioned schema migrations. Each one runs once, in order, in its own transaction, and is recorded in schema_version.
+#The bot runs these at startup; db_migrate.py runs them by hand.
+import json, os, time
+
+from sqlalchemy import text
+
+from modules import database
+
+seedPath = os.path.join(os.path.dirname(__file__), 'seed_data.json')
+
+def isEmpty(connection, tableName: str) -> bool:
+    return connection.execute(text('SELECT COUNT(*) FROM {};'.format(tableName))).scalar() == 0
+
+#The tables the bot has always had, seeded with the Bob Ross quotes and Bovonto pitches if they're empty
+def createBaseTables(connection):
+    connection.execute(text('CREATE TABLE IF NOT EXISTS posts (ID INT PRIMARY KEY, post_name TEXT, link TEXT);'))
+    connection.execute(text('CREATE TABLE IF NOT EXISTS bobQuotes (id INTEGER NOT NULL, quote VARCHAR, PRIMARY KEY (id));'))
+    connection.execute(text('CREATE TABLE IF NOT EXISTS bovontoPitches (id INTEGER NOT NULL, pitch VARCHAR, PRIMARY KEY (id));'))
+    with open(seedPath, encoding='utf-8') as f:
+        seed = json.load(f)
+    if isEmpty(connection, 'bobQuotes'):
+        connection.execute(text('INSERT INTO bobQuotes (quote) VALUES (:quote);'), [{'quote': q} for q in seed['bobQuotes']])
+    if isEmpty(connection, 'bovontoPitches'):
+        connection.execute(text('INSERT INTO bovontoPitches (pitch) VALUES (:pitch);'), [{'pitch': p} for p in seed['bovontoPitches']])
+
+#Link rewrite rules, seeded with the hosts that used to be hardcoded
+def createLinkRewrites(connection):
+    connection.execute(text("""CREATE TABLE IF NOT EXISTS link_rewrites (
+        id INTEGER PRIMARY KEY,
+        source_host TEXT NOT NULL,
+        target_host TEXT NOT NULL,
+        enabled INTEGER NOT NULL DEFAULT 1,
+        channel_id INTEGER
+    );"""))
+    if isEmpty(connection, 'link_rewrites'):
+        connection.execute(text('INSERT INTO link_rewrites (source_host, target_host) VALUES (:source, :target);'), [
+            {'source': 'x.com', 'target': 'fixupx.com'},
+            {'source': 'instagram.com', 'target': 'ddinstagram.com'},
+            {'source': 'tiktok.com', 'target': 'vxtiktok.com'},
+        ])
+
+#Results from the dead link scanner
+def createLinkStatus(connection):
+    connection.execute(text("""CREATE TABLE IF NOT EXISTS link_status (
+        link TEXT PRIMARY KEY,
+        status INTEGER NOT NULL,
+        alive INTEGER NOT NULL,
+        checked_at REAL NOT NULL
+    );"""))
+
+#Meme names are unique, ignoring case. Duplicates are dropped first, keeping the oldest, which is the one /bb always returned.
+def uniqueMemeNames(connection):
+    connection.execute(text('DELETE FROM posts WHERE rowid NOT IN (SELECT MIN(rowid) FROM posts GROUP BY post_name COLLATE NOCASE);'))
+    connection.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS posts_post_name ON posts (post_name COLLATE NOCASE);'))
+
+#(version, function). Only ever add to the end of this list.
+migrations = [
+    (1, createBaseTables),
+    (2, createLinkRewrites),
+    (3, createLinkStatus),
+    (4, uniqueMemeNames),
+]
+
+#Applies every migration newer than the database. Blocking, so the bot runs it on the db executor.
+#* Returns list of versions applied
+def migrate(engine=None) -> list:
+    engine = engine or database.engine
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at REAL NOT NULL);'))
+        current = connection.execute(text('SELECT MAX(version) FROM schema_version;')).scalar() or 0
+    applied = []
+    for version, migration in migrations:
+        if version <= current:
+            continue
+        with engine.begin() as connection:
+            migration(connection)
+            connection.execute(text('INSERT INTO schema_version (version, name, applied_at) VALUES (:version, :name, :now);'),
+                               {'version': version, 'name': migration.__name__, 'now': time.time()})
+        applied.append(version)
+    return applied
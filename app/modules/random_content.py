@@ -0,0 +1,42 @@
+#Random row picker for the quote tables. Keeps the table's ids in memory so a pick is one query, and id gaps don't matter.
+import random, time
+
+from modules.repositories import QuoteRepository
+
+class RandomPicker:
+    # shuffleBag: deal every row once, in random order, before any repeats
+    # maxAge: seconds before the cached ids are reloaded. The bot never writes these tables, so this is how edits made
+    #   straight to the db get picked up.
+    def __init__(self, quotes: QuoteRepository, shuffleBag: bool = False, maxAge: float = 3600):
+        self.quotes = quotes
+        self.shuffleBag = shuffleBag
+        self.maxAge = maxAge
+        self.ids = []
+        self.bag = []
+        self.loadedAt = None
+
+    async def refresh(self):
+        self.ids = await self.quotes.ids()
+        self.bag = []
+        self.loadedAt = time.monotonic()
+
+    def nextId(self):
+        if not self.shuffleBag:
+            return random.choice(self.ids)
+        if not self.bag:
+            self.bag = random.sample(self.ids, len(self.ids))
+        return self.bag.pop()
+
+    #* Returns a random value from the column, or None if the table is empty
+    async def pick(self):
+        if self.loadedAt is None or time.monotonic() - self.loadedAt > self.maxAge:
+            await self.refresh()
+        # a second attempt covers rows deleted since the ids were cached
+        for attempt in range(2):
+            if not self.ids:
+                return None
+            quote = await self.quotes.get(self.nextId())
+            if quote is not None:
+                return quote
+            await self.refresh()
+        return None
@@ -0,0 +1,84 @@
+#Token bucket rate limiting for commands, per user and per channel
+import os, time
+
+from discord.ext import commands
+
+#Raised from a command's before-invoke hook when the user or channel is out of tokens
+class RateLimited(commands.CommandError):
+    def __init__(self, retryAfter: float, scope: str):
+        self.retryAfter = retryAfter
+        self.scope = scope
+        super().__init__('Rate limited per {0}, try again in {1:.1f}s'.format(scope, retryAfter))
+
+class TokenBucket:
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+#A token bucket per key. Each bucket holds up to `rate` tokens and refills at `rate` tokens every `per` seconds.
+class RateLimiter:
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.refill = rate / per
+        self.buckets = {}
+        self.lastSweep = time.monotonic()
+
+    def refilled(self, bucket: TokenBucket, now: float) -> float:
+        return min(self.rate, bucket.tokens + (now - bucket.updated) * self.refill)
+
+    #* Returns seconds until the key has a token, 0 if it has one now
+    def retryAfter(self, key, now: float) -> float:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return 0
+        tokens = self.refilled(bucket, now)
+        return 0 if tokens >= 1 else (1 - tokens) / self.refill
+
+    def take(self, key, now: float):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = TokenBucket(self.rate - 1, now)
+        else:
+            bucket.tokens = self.refilled(bucket, now) - 1
+            bucket.updated = now
+        self.evictIdle(now)
+
+    # A bucket that has refilled all the way is the same as no bucket, so drop those every `per` seconds
+    def evictIdle(self, now: float):
+        if now - self.lastSweep < self.per:
+            return
+        self.lastSweep = now
+        for key in [k for k, b in self.buckets.items() if self.refilled(b, now) >= self.rate]:
+            del self.buckets[key]
+
+#Limits one command per user and per channel. Runs as the command's before-invoke hook, which discord.py calls exactly
+#  once per invocation for both prefix and slash use (hybrid checks run twice for slash commands and would take two tokens).
+class CommandThrottle:
+    def __init__(self, userRate: int, userPer: float, channelRate: int, channelPer: float):
+        self.users = RateLimiter(userRate, userPer)
+        self.channels = RateLimiter(channelRate, channelPer)
+
+    async def hook(self, ctx):
+        now = time.monotonic()
+        for scope, limiter, key in (('user', self.users, ctx.author.id), ('channel', self.channels, ctx.channel.id)):
+            wait = limiter.retryAfter(key, now)
+            if wait > 0:
+                raise RateLimited(wait, scope)
+        self.users.take(ctx.author.id, now)
+        self.channels.take(ctx.channel.id, now)
+
+#Default limits, as "<commands>/<seconds>"
+def parseLimit(value: str) -> tuple:
+    rate, per = value.split('/')
+    return int(rate), float(per)
+
+userLimit = parseLimit(os.environ.get('COMMAND_USER_LIMIT', '3/10'))
+channelLimit = parseLimit(os.environ.get('COMMAND_CHANNEL_LIMIT', '10/10'))
+
+#Decorator that rate limits a command. Put it below the command decorator.
+def throttle(user: tuple = userLimit, channel: tuple = channelLimit):
+    limiter = CommandThrottle(user[0], user[1], channel[0], channel[1])
+    return commands.before_invoke(limiter.hook)
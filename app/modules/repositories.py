@@ -0,0 +1,47 @@
+#All the meme and quote SQL in one place. Statements are built once with bound parameters, so user input never ends up
+#  in the SQL text and SQLAlchemy/sqlite can reuse the compiled and prepared statements.
+from sqlalchemy import text
+
+from modules import database
+
+#Escapes LIKE wildcards so a search term only ever matches itself
+def likeContaining(term: str) -> str:
+    return '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+class MemeRepository:
+    selectAll = text('SELECT post_name, link FROM posts;')
+    selectNames = text('SELECT post_name FROM posts;')
+    insert = text('INSERT INTO posts (post_name, link) VALUES (:name, :link);')
+    deleteContaining = text("DELETE FROM posts WHERE post_name LIKE :pattern ESCAPE '\\';")
+
+    #* Returns list of (post_name, link)
+    async def all(self) -> list:
+        return await database.fetchAll(self.selectAll)
+
+    async def add(self, name: str, link: str):
+        await database.execute(self.insert, {'name': name, 'link': link})
+
+    #Deletes every meme whose name contains the term
+    #* Returns number of memes deleted
+    async def removeContaining(self, term: str) -> int:
+        return await database.execute(self.deleteContaining, {'pattern': likeContaining(term)})
+
+class QuoteRepository:
+    # Table and column names can't be bound parameters, so only these are allowed in
+    tables = {'bobQuotes': 'quote', 'bovontoPitches': 'pitch'}
+
+    def __init__(self, tableName: str):
+        if tableName not in self.tables:
+            raise ValueError('Unknown quote table {}'.format(tableName))
+        self.tableName = tableName
+        self.selectIds = text('SELECT id FROM {};'.format(tableName))
+        self.selectById = text('SELECT {} FROM {} WHERE id = :id;'.format(self.tables[tableName], tableName))
+
+    #* Returns list of int
+    async def ids(self) -> list:
+        return [row[0] for row in await database.fetchAll(self.selectIds)]
+
+    #* Returns the quote, or None if there's no row with that id
+    async def get(self, id: int):
+        row = await database.fetchOne(self.selectById, {'id': id})
+        return None if row is None else row[0]
@@ -0,0 +1,41 @@
+#Per-guild role lookup tables, so reaction and pronoun handlers don't scan guild.roles every time
+import discord
+
+class GuildRoles:
+    __slots__ = ('byName', 'pronouns')
+
+    def __init__(self, guild: discord.Guild, restrictedRoles: list):
+        # role name -> Role. First one wins on duplicate names, same as discord.utils.get
+        self.byName = {}
+        for role in guild.roles:
+            self.byName.setdefault(role.name, role)
+        # roles that look like pronouns and that we're allowed to hand out, highest first
+        self.pronouns = tuple(r for r in reversed(guild.roles) if r.is_assignable() and (r.name.find('/') > -1) and (not r.name in restrictedRoles))
+
+class RoleIndex:
+    def __init__(self, restrictedRoles: list):
+        self.restrictedRoles = restrictedRoles
+        # guild id -> GuildRoles
+        self.guilds = {}
+
+    #(Re)builds the tables for a guild. Call whenever its roles, or the bot's own roles, change.
+    def build(self, guild: discord.Guild) -> GuildRoles:
+        roles = GuildRoles(guild, self.restrictedRoles)
+        self.guilds[guild.id] = roles
+        return roles
+
+    def forget(self, guild: discord.Guild):
+        self.guilds.pop(guild.id, None)
+
+    def forGuild(self, guild: discord.Guild) -> GuildRoles:
+        roles = self.guilds.get(guild.id)
+        if roles is None:
+            roles = self.build(guild)
+        return roles
+
+    #* Returns Role or None
+    def get(self, guild: discord.Guild, name: str):
+        return self.forGuild(guild).byName.get(name)
+
+    def pronouns(self, guild: discord.Guild) -> tuple:
+        return self.forGuild(guild).pronouns
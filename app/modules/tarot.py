@@ -0,0 +1,66 @@
+#Tarot deck, loaded from tarot_deck.json on the first draw instead of at startup
+import discord, json, os, random
+
+deckPath = os.path.join(os.path.dirname(__file__), 'tarot_deck.json')
+
+class Card:
+    __slots__ = ('title', 'keywords', 'meaning', 'yesno', 'url', 'image')
+
+    def __init__(self, title: str, keywords: list, meaning: str, yesno: str, url: str, image: str):
+        self.title = title
+        self.keywords = tuple(keywords)
+        self.meaning = meaning
+        self.yesno = yesno
+        self.url = url
+        self.image = image
+
+    # the full reading is just the keywords followed by the meaning, so it isn't stored
+    @property
+    def reading(self) -> str:
+        return ', '.join(self.keywords) + '\n' + self.meaning
+
+    # an upright card and its reversal share a name
+    @property
+    def name(self) -> str:
+        return self.title.replace(' (Reversed)', '')
+
+def buildCardEmbed(card: Card) -> discord.Embed:
+    emb = discord.Embed(type='rich', title=card.title, description=card.meaning, url=card.url)
+    emb.add_field(name='Keywords', value=', '.join(card.keywords) )
+    emb.add_field(name='Yes/No?', value=card.yesno)
+    emb.set_image(url=card.image)
+    emb.set_footer(text='Images © Labyrinthos LLC')
+    return emb
+
+class Deck:
+    __slots__ = ('isTemplate', 'cards', 'embeds', 'groups')
+
+    def __init__(self, data: dict):
+        # a deck file with a __template key is a placeholder that still needs real cards
+        self.isTemplate = '__template' in data
+        self.cards = () if self.isTemplate else tuple(Card(**card) for card in data.get('deck', []))
+        # one embed per card index. Sending only reads an embed, so these go out as-is; never edit them in place.
+        self.embeds = tuple(buildCardEmbed(card) for card in self.cards)
+        # card indices grouped so an upright card and its reversal count as the same card
+        groups = {}
+        for index, card in enumerate(self.cards):
+            groups.setdefault(card.name, []).append(index)
+        self.groups = tuple(tuple(group) for group in groups.values())
+
+    def randomEmbed(self) -> discord.Embed:
+        return random.choice(self.embeds)
+
+    #Draws distinct cards without replacement, each one upright or reversed
+    #* Returns list of embeds
+    def drawSpread(self, count: int) -> list:
+        return [self.embeds[random.choice(group)] for group in random.sample(self.groups, count)]
+
+_deck = None
+
+#* Returns the Deck, reading it from disk the first time
+def loadDeck() -> Deck:
+    global _deck
+    if _deck is None:
+        with open(deckPath, encoding='utf-8') as f:
+            _deck = Deck(json.load(f))
+    return _deck
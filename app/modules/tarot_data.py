@@ -1,2754 +0,0 @@
-tarotData = {'deck': [{'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-38.png',
-        'keywords': ['happy surprise', 'dreamer', 'sensitivity'],
-        'meaning': 'The Page of Cups heralds a happy surprise of some '
-                   'kind. The fish that pops out of the cup is a '
-                   'signal that one’s unconscious is attempting to '
-                   'make contact, though sometimes one does not '
-                   'understand what is meant to be said.',
-        'reading': 'happy surprise, dreamer, sensitivity\n'
-                   'The Page of Cups heralds a happy surprise of some '
-                   'kind. The fish that pops out of the cup is a '
-                   'signal that one’s unconscious is attempting to '
-                   'make contact, though sometimes one does not '
-                   'understand what is meant to be said.',
-        'title': 'Page of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-38.png',
-        'keywords': ['emotional immaturity', 'insecurity',
-                    'disappointment'],
-        'meaning': 'The inner child as represented by the Page of Cups '
-                   'can at times act exactly like a child. While '
-                   'sometimes full of wonder and happiness, he can '
-                   'also fly off into tantrums and into the world of '
-                   'his imagination, leaving all reality behind.',
-        'reading': 'emotional immaturity, insecurity, disappointment\n'
-                   'The inner child as represented by the Page of Cups '
-                   'can at times act exactly like a child. While '
-                   'sometimes full of wonder and happiness, he can '
-                   'also fly off into tantrums and into the world of '
-                   'his imagination, leaving all reality behind.',
-        'title': 'Page of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-39.png',
-        'keywords': ['following the heart', 'idealist', 'romantic'],
-        'meaning': 'A man who is in touch with his emotions and '
-                   'intuition and is able to channel them into action. '
-                   'It can signal an arrival or an invitation into '
-                   'something that will be the cause of celebration.',
-        'reading': 'following the heart, idealist, romantic\n'
-                   'A man who is in touch with his emotions and '
-                   'intuition and is able to channel them into action. '
-                   'It can signal an arrival or an invitation into '
-                   'something that will be the cause of celebration.',
-        'title': 'Knight of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-39.png',
-        'keywords': ['moodiness', 'disappointment'],
-        'meaning': 'Being ruled by the heart and not the head, the '
-                   'Knight of Cups can sometimes be prone to quickly '
-                   'evolving and heated emotions. His invitation, '
-                   'though charming at first, can become problematic '
-                   'because of his inability to control his feelings.',
-        'reading': 'moodiness, disappointment\n'
-                   'Being ruled by the heart and not the head, the '
-                   'Knight of Cups can sometimes be prone to quickly '
-                   'evolving and heated emotions. His invitation, '
-                   'though charming at first, can become problematic '
-                   'because of his inability to control his feelings.',
-        'title': 'Knight of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-40.png',
-        'keywords': ['compassion', 'calm', 'comfort'],
-        'meaning': 'A figure in your life that is nurturing, '
-                   'compassionate and able to instinctively understand '
-                   'the emotions of others. Because of this, they are '
-                   'usually generous and kind hearted.',
-        'reading': 'compassion, calm, comfort\n'
-                   'A figure in your life that is nurturing, '
-                   'compassionate and able to instinctively understand '
-                   'the emotions of others. Because of this, they are '
-                   'usually generous and kind hearted.',
-        'title': 'Queen of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-40.png',
-        'keywords': ['martyrdom', 'insecurity', 'dependence'],
-        'meaning': 'The river of compassion has run dry - this figure '
-                   'now exudes coldness where there was once love. On '
-                   'the opposite end, perhaps you have become too '
-                   'reliant on the kindness of this figure. How can '
-                   'you achieve independence? Either way, there is a '
-                   'feeling of emotional instability that comes with '
-                   'this card.',
-        'reading': 'martyrdom, insecurity, dependence\n'
-                   'The river of compassion has run dry - this figure '
-                   'now exudes coldness where there was once love. On '
-                   'the opposite end, perhaps you have become too '
-                   'reliant on the kindness of this figure. How can '
-                   'you achieve independence? Either way, there is a '
-                   'feeling of emotional instability that comes with '
-                   'this card.',
-        'title': 'Queen of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-41.png',
-        'keywords': ['compassion', 'control', 'balance'],
-        'meaning': 'A man whose greatest quality is his ability to '
-                   'control, balance and master his emotions. He is '
-                   'not empty of feelings, but rather full of them - '
-                   'only, he understands when and where they are '
-                   'appropriate and beneficial, and when they are '
-                   'harmful. He is a man of compassion, diplomacy and '
-                   'generosity.',
-        'reading': 'compassion, control, balance\n'
-                   'A man whose greatest quality is his ability to '
-                   'control, balance and master his emotions. He is '
-                   'not empty of feelings, but rather full of them - '
-                   'only, he understands when and where they are '
-                   'appropriate and beneficial, and when they are '
-                   'harmful. He is a man of compassion, diplomacy and '
-                   'generosity.',
-        'title': 'King of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-41.png',
-        'keywords': ['coldness', 'moodiness', 'bad advice'],
-        'meaning': 'A master in emotions, the King of Cups can choose '
-                   'to use his understanding of human feeling to '
-                   'create peace or strife. What are his intentions? '
-                   'On the other hand, perhaps someone who is usually '
-                   'calm is losing his grip on his otherwise stable '
-                   'emotions.',
-        'reading': 'coldness, moodiness, bad advice\n'
-                   'A master in emotions, the King of Cups can choose '
-                   'to use his understanding of human feeling to '
-                   'create peace or strife. What are his intentions? '
-                   'On the other hand, perhaps someone who is usually '
-                   'calm is losing his grip on his otherwise stable '
-                   'emotions.',
-        'title': 'King of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-42.png',
-        'keywords': ['new feelings', 'spirituality', 'intuition'],
-        'meaning': 'As with other ace cards, the ace of cups '
-                   'symbolizes new beginnings. It is the start of a '
-                   'feeling of emotional fulfillment - and represents '
-                   'the joy of giving, and getting in return.',
-        'reading': 'new feelings, spirituality, intuition\n'
-                   'As with other ace cards, the ace of cups '
-                   'symbolizes new beginnings. It is the start of a '
-                   'feeling of emotional fulfillment - and represents '
-                   'the joy of giving, and getting in return.',
-        'title': 'Ace of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-42.png',
-        'keywords': ['emotional loss', 'blocked creativity',
-                    'emptiness'],
-        'meaning': 'When the Ace of Cups is reversed, the cup is '
-                   'empty, drained of the powers that it could '
-                   'potentially give. Something wonderful is being '
-                   'wasted or blocked, what can you do to reclaim its '
-                   'soothing waters?',
-        'reading': 'emotional loss, blocked creativity, emptiness\n'
-                   'When the Ace of Cups is reversed, the cup is '
-                   'empty, drained of the powers that it could '
-                   'potentially give. Something wonderful is being '
-                   'wasted or blocked, what can you do to reclaim its '
-                   'soothing waters?',
-        'title': 'Ace of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-43.png',
-        'keywords': ['unity', 'partnership', 'connection'],
-        'meaning': 'Signaling a union and partnership of balance, '
-                   'honor and respect. The ancient symbol of the '
-                   'caduceus also suggests energy, passion and sex, '
-                   'and the intermingling of opposite forces.',
-        'reading': 'unity, partnership, connection\n'
-                   'Signaling a union and partnership of balance, '
-                   'honor and respect. The ancient symbol of the '
-                   'caduceus also suggests energy, passion and sex, '
-                   'and the intermingling of opposite forces.',
-        'title': 'II of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-43.png',
-        'keywords': ['imbalance', 'broken communication', 'tension'],
-        'meaning': 'Having a lasting and equal partnership is '
-                   'difficult here, the communication between either '
-                   'party has broken down somehow, and it is difficult '
-                   'to get on the same footing again. What can you do '
-                   'make this relationship more meaningful?',
-        'reading': 'imbalance, broken communication, tension\n'
-                   'Having a lasting and equal partnership is '
-                   'difficult here, the communication between either '
-                   'party has broken down somehow, and it is difficult '
-                   'to get on the same footing again. What can you do '
-                   'make this relationship more meaningful?',
-        'title': 'II of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-44.png',
-        'keywords': ['friendship', 'community', 'happiness'],
-        'meaning': 'A warm and lively gathering of friends. You are '
-                   'blessed with loving relationships and camaraderie, '
-                   'and this is likely a very social period in your '
-                   'life where you are investing time in the people '
-                   'around you.',
-        'reading': 'friendship, community, happiness\n'
-                   'A warm and lively gathering of friends. You are '
-                   'blessed with loving relationships and camaraderie, '
-                   'and this is likely a very social period in your '
-                   'life where you are investing time in the people '
-                   'around you.',
-        'title': 'III of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-44.png',
-        'keywords': ['overindulgence', 'gossip', 'isolation'],
-        'meaning': 'At times, having too many relationships and '
-                   'acquaintances can be harmful to your '
-                   'self-development. Instead of a support network, is '
-                   'your group causing you to act in a way where you '
-                   'are no longer independent? Or conversely, have you '
-                   'been isolated without a support group?',
-        'reading': 'overindulgence, gossip, isolation\n'
-                   'At times, having too many relationships and '
-                   'acquaintances can be harmful to your '
-                   'self-development. Instead of a support network, is '
-                   'your group causing you to act in a way where you '
-                   'are no longer independent? Or conversely, have you '
-                   'been isolated without a support group?',
-        'title': 'III of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-45.png',
-        'keywords': ['apathy', 'contemplation', 'disconnectedness'],
-        'meaning': 'Being so deep in contemplation and thought, you '
-                   'may sometimes ignore the gifts that the world '
-                   'gives you. The potential joys that are laid at '
-                   'your feet are ignored. Even though your intentions '
-                   'may be noble, you run the risk of treating the '
-                   'world with apathy.',
-        'reading': 'apathy, contemplation, disconnectedness\n'
-                   'Being so deep in contemplation and thought, you '
-                   'may sometimes ignore the gifts that the world '
-                   'gives you. The potential joys that are laid at '
-                   'your feet are ignored. Even though your intentions '
-                   'may be noble, you run the risk of treating the '
-                   'world with apathy.',
-        'title': 'IV of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-45.png',
-        'keywords': ['sudden awareness', 'choosing happiness',
-                    'acceptance'],
-        'meaning': 'In your search for something meaningful, you have '
-                   'perhaps been lead to ignore the potential '
-                   'happiness that is given to you. So much inner '
-                   'focus has made you lose your way, and you have '
-                   'begun to deny the wonders that the world offers. '
-                   'Find balance; you must both look inward and out.',
-        'reading': 'sudden awareness, choosing happiness, acceptance\n'
-                   'In your search for something meaningful, you have '
-                   'perhaps been lead to ignore the potential '
-                   'happiness that is given to you. So much inner '
-                   'focus has made you lose your way, and you have '
-                   'begun to deny the wonders that the world offers. '
-                   'Find balance; you must both look inward and out.',
-        'title': 'IV of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-46.png',
-        'keywords': ['loss', 'grief', 'self-pity'],
-        'meaning': 'This card signifies the despair and sadness '
-                   'associated with loss. Three of the cups are '
-                   'overturned, but two of them are still upright, '
-                   'indicating that there is still a chance to salvage '
-                   'what has been lost.',
-        'reading': 'loss, grief, self-pity\n'
-                   'This card signifies the despair and sadness '
-                   'associated with loss. Three of the cups are '
-                   'overturned, but two of them are still upright, '
-                   'indicating that there is still a chance to salvage '
-                   'what has been lost.',
-        'title': 'V of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-46.png',
-        'keywords': ['acceptance', 'moving on', 'finding peace'],
-        'meaning': 'Though times were dark, you may have recently been '
-                   'able to pull yourself out of a painful situation '
-                   'by looking forwards. And through that you have '
-                   "found that not all has been lost. You're beginning "
-                   'the process of moving on, and healing from the '
-                   'recent pain.',
-        'reading': 'acceptance, moving on, finding peace\n'
-                   'Though times were dark, you may have recently been '
-                   'able to pull yourself out of a painful situation '
-                   'by looking forwards. And through that you have '
-                   "found that not all has been lost. You're beginning "
-                   'the process of moving on, and healing from the '
-                   'recent pain.',
-        'title': 'V of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-47.png',
-        'keywords': ['familiarity', 'happy memories', 'healing'],
-        'meaning': 'The happy meeting between past and present is '
-                   'indicated here. There is a sense of wonderful '
-                   'nostalgia for times long ago. The memories coming '
-                   'back though, can sometimes be so engrossing that '
-                   'you begin to forget your present.',
-        'reading': 'familiarity, happy memories, healing\n'
-                   'The happy meeting between past and present is '
-                   'indicated here. There is a sense of wonderful '
-                   'nostalgia for times long ago. The memories coming '
-                   'back though, can sometimes be so engrossing that '
-                   'you begin to forget your present.',
-        'title': 'VI of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-47.png',
-        'keywords': ['moving forward', 'leaving home', 'independence'],
-        'meaning': 'When the past becomes more important than the '
-                   'present, you begin to lose the ability to progress '
-                   'forward. Looking back is important in order to '
-                   "understand how to act, but don't let it block your "
-                   'progress.',
-        'reading': 'moving forward, leaving home, independence\n'
-                   'When the past becomes more important than the '
-                   'present, you begin to lose the ability to progress '
-                   'forward. Looking back is important in order to '
-                   "understand how to act, but don't let it block your "
-                   'progress.',
-        'title': 'VI of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-48.png',
-        'keywords': ['searching for purpose', 'choices', 'daydreaming'],
-        'meaning': 'A range of choices present themselves to you, some '
-                   'of which promise power, riches, victory and love, '
-                   'and others that instead present you with disaster. '
-                   'Danger lurks within the choices, and wishful '
-                   'thinking and fantasy can lead one into trouble.',
-        'reading': 'searching for purpose, choices, daydreaming\n'
-                   'A range of choices present themselves to you, some '
-                   'of which promise power, riches, victory and love, '
-                   'and others that instead present you with disaster. '
-                   'Danger lurks within the choices, and wishful '
-                   'thinking and fantasy can lead one into trouble.',
-        'title': 'VII of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-48.png',
-        'keywords': ['lack of purpose', 'diversion', 'confusion'],
-        'meaning': 'Beware of the things that are being offered to you '
-                   'at the moment - you are either unable to think '
-                   'rationally now, or something dangerous lurks '
-                   'behind what gilded promises. All that glitters is '
-                   'not gold, and temptation can draw you to ruin.',
-        'reading': 'lack of purpose, diversion, confusion\n'
-                   'Beware of the things that are being offered to you '
-                   'at the moment - you are either unable to think '
-                   'rationally now, or something dangerous lurks '
-                   'behind what gilded promises. All that glitters is '
-                   'not gold, and temptation can draw you to ruin.',
-        'title': 'VII of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-49.png',
-        'keywords': ['walking away', 'disillusionment',
-                    'leaving behind'],
-        'meaning': 'There is a feeling of disappointment and loss '
-                   'associated with this card. One has taken a '
-                   'retrospective of their situation and has decided '
-                   'to leave it behind. Something is abandoned, and '
-                   'through that abandonment, one feels the loss of a '
-                   'part of themselves.',
-        'reading': 'walking away, disillusionment, leaving behind\n'
-                   'There is a feeling of disappointment and loss '
-                   'associated with this card. One has taken a '
-                   'retrospective of their situation and has decided '
-                   'to leave it behind. Something is abandoned, and '
-                   'through that abandonment, one feels the loss of a '
-                   'part of themselves.',
-        'title': 'VIII of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-49.png',
-        'keywords': ['avoidance', 'fear of change', 'fear of loss'],
-        'meaning': 'Though you have come to terms with understanding '
-                   'that sometimes walking away is necessary to your '
-                   'well being, part of you is still on the fence. You '
-                   'are afraid of losing what you have already '
-                   'accumulated. You drift back and forth between '
-                   'making the decision to cut your losses or stay in '
-                   'a bad situation.',
-        'reading': 'avoidance, fear of change, fear of loss\n'
-                   'Though you have come to terms with understanding '
-                   'that sometimes walking away is necessary to your '
-                   'well being, part of you is still on the fence. You '
-                   'are afraid of losing what you have already '
-                   'accumulated. You drift back and forth between '
-                   'making the decision to cut your losses or stay in '
-                   'a bad situation.',
-        'title': 'VIII of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-50.png',
-        'keywords': ['satisfaction', 'emotional stability', 'luxury'],
-        'meaning': 'An environment of luxury and emotional stability, '
-                   'where all available comforts await you. Indulging '
-                   'in all the joys that life has to offer you is '
-                   'signaled by this card, though at times there is a '
-                   'sense of smugness that comes from taking your '
-                   'situation for granted.',
-        'reading': 'satisfaction, emotional stability, luxury\n'
-                   'An environment of luxury and emotional stability, '
-                   'where all available comforts await you. Indulging '
-                   'in all the joys that life has to offer you is '
-                   'signaled by this card, though at times there is a '
-                   'sense of smugness that comes from taking your '
-                   'situation for granted.',
-        'title': 'IX of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-50.png',
-        'keywords': ['lack of inner joy', 'smugness',
-                    'dissatisfaction'],
-        'meaning': 'There seems to be so much to celebrate right now, '
-                   'as you are able to have almost everything that you '
-                   'desire. But there is the lingering feeling that '
-                   'still something else is missing. It seems that '
-                   'there is no end in sight to what you still want. '
-                   'Or perhaps, there is some key element that is '
-                   'still not within your grasp.',
-        'reading': 'lack of inner joy, smugness, dissatisfaction\n'
-                   'There seems to be so much to celebrate right now, '
-                   'as you are able to have almost everything that you '
-                   'desire. But there is the lingering feeling that '
-                   'still something else is missing. It seems that '
-                   'there is no end in sight to what you still want. '
-                   'Or perhaps, there is some key element that is '
-                   'still not within your grasp.',
-        'title': 'IX of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-51.png',
-        'keywords': ['inner happiness', 'fulfillment',
-                    'dreams coming true'],
-        'meaning': 'Emotional fulfillment and happiness due to a deep '
-                   'sense of unity with the world around you. This '
-                   'card is about harmony and the joy that results '
-                   'from it, applying to your family, friends and '
-                   'loved ones. There is a deep sense of community '
-                   'associated with this card.',
-        'reading': 'inner happiness, fulfillment, dreams coming true\n'
-                   'Emotional fulfillment and happiness due to a deep '
-                   'sense of unity with the world around you. This '
-                   'card is about harmony and the joy that results '
-                   'from it, applying to your family, friends and '
-                   'loved ones. There is a deep sense of community '
-                   'associated with this card.',
-        'title': 'X of Cups',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/cups-51.png',
-        'keywords': ['shattered dreams', 'broken family',
-                    'domestic disharmony'],
-        'meaning': 'The joy that you should be getting when you '
-                   'reunite and connect with family and the community '
-                   'around you is not happening right now. For one '
-                   'reason or another, your desire to create peace and '
-                   'understanding amongst loved ones is failing.',
-        'reading': 'shattered dreams, broken family, domestic '
-                   'disharmony\n'
-                   'The joy that you should be getting when you '
-                   'reunite and connect with family and the community '
-                   'around you is not happening right now. For one '
-                   'reason or another, your desire to create peace and '
-                   'understanding amongst loved ones is failing.',
-        'title': 'X of Cups (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-cups-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-02.png',
-        'keywords': ['innocence', 'new beginnings', 'free spirit'],
-        'meaning': 'The major arcana tells the story of an '
-                   "individual's path towards completion. Being the "
-                   'first card, the fool therefore is a blank slate, a '
-                   'representation of purity and innocence of a child '
-                   'that knows nothing of the world. New journeys are '
-                   'signaled here, and the fool is full of exuberance '
-                   'and energy. He does not know the dangers that can '
-                   'beset him during his travels, and thus he stumbles '
-                   'forward with complete optimism, never suspecting '
-                   'that he may be walking on a thin tight rope.',
-        'reading': 'innocence, new beginnings, free spirit\n'
-                   'The major arcana tells the story of an '
-                   "individual's path towards completion. Being the "
-                   'first card, the fool therefore is a blank slate, a '
-                   'representation of purity and innocence of a child '
-                   'that knows nothing of the world. New journeys are '
-                   'signaled here, and the fool is full of exuberance '
-                   'and energy. He does not know the dangers that can '
-                   'beset him during his travels, and thus he stumbles '
-                   'forward with complete optimism, never suspecting '
-                   'that he may be walking on a thin tight rope.',
-        'title': 'The Fool',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-fool-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-02.png',
-        'keywords': ['recklessness', 'taken advantage of',
-                    'inconsideration'],
-        'meaning': 'In your excitement to start a new journey, you '
-                   'have not heeded the dangers that surround you. '
-                   'This card suggests excessive eagerness and no '
-                   'awareness of consequences. You must plan more '
-                   'carefully your journey ahead. Who else do your '
-                   'actions affect?',
-        'reading': 'recklessness, taken advantage of, inconsideration\n'
-                   'In your excitement to start a new journey, you '
-                   'have not heeded the dangers that surround you. '
-                   'This card suggests excessive eagerness and no '
-                   'awareness of consequences. You must plan more '
-                   'carefully your journey ahead. Who else do your '
-                   'actions affect?',
-        'title': 'The Fool (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-fool-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-03.png',
-        'keywords': ['willpower', 'desire', 'creation',
-                    'manifestation'],
-        'meaning': 'The Magician is the representation of pure '
-                   'willpower. She takes all that is available to her '
-                   'and molds and transforms it to her desires. With '
-                   'her hand pointing to the ground and her wand '
-                   'pointing to the sky, she is the manifestation of '
-                   'the ancient phrase “as above so below” - meaning '
-                   'that earth reflects heaven, what is within is also '
-                   'without, the microcosm is the macrocosm. '
-                   'Naturally, this phrase is the origin of what is '
-                   "commonly understood as 'magic'.",
-        'reading': 'willpower, desire, creation, manifestation\n'
-                   'The Magician is the representation of pure '
-                   'willpower. She takes all that is available to her '
-                   'and molds and transforms it to her desires. With '
-                   'her hand pointing to the ground and her wand '
-                   'pointing to the sky, she is the manifestation of '
-                   'the ancient phrase “as above so below” - meaning '
-                   'that earth reflects heaven, what is within is also '
-                   'without, the microcosm is the macrocosm. '
-                   'Naturally, this phrase is the origin of what is '
-                   "commonly understood as 'magic'.",
-        'title': 'The Magician',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-magician-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-03.png',
-        'keywords': ['trickery', 'illusions', 'out of touch'],
-        'meaning': 'There are those that use their abilities for '
-                   'continual self-gain, and through that weave '
-                   'illusions and lies. A reversal here might indicate '
-                   'that you are getting further and further away from '
-                   'truth.',
-        'reading': 'trickery, illusions, out of touch\n'
-                   'There are those that use their abilities for '
-                   'continual self-gain, and through that weave '
-                   'illusions and lies. A reversal here might indicate '
-                   'that you are getting further and further away from '
-                   'truth.',
-        'title': 'The Magician (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-magician-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-04.png',
-        'keywords': ['intuitive', 'unconscious', 'inner voice'],
-        'meaning': 'To direct your will outward one must also be able '
-                   'to understand one’s internal world. The High '
-                   'Priestess is the guardian of the unconscious and '
-                   'beckons the traveller to the world within.',
-        'reading': 'intuitive, unconscious, inner voice\n'
-                   'To direct your will outward one must also be able '
-                   'to understand one’s internal world. The High '
-                   'Priestess is the guardian of the unconscious and '
-                   'beckons the traveller to the world within.',
-        'title': 'The High Priestess',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-high-priestess-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-04.png',
-        'keywords': ['lack of center', 'lost inner voice',
-                    'repressed feelings'],
-        'meaning': 'The High Priestess reversed calls for you to '
-                   'listen closely to what your inner self tells you. '
-                   'There was a time in which you heard her, but along '
-                   'the twists and turns along the path of life, her '
-                   'voice has been silenced somehow. What parts of '
-                   'your unconscious are you denying? What is it '
-                   'trying to say?',
-        'reading': 'lack of center, lost inner voice, repressed '
-                   'feelings\n'
-                   'The High Priestess reversed calls for you to '
-                   'listen closely to what your inner self tells you. '
-                   'There was a time in which you heard her, but along '
-                   'the twists and turns along the path of life, her '
-                   'voice has been silenced somehow. What parts of '
-                   'your unconscious are you denying? What is it '
-                   'trying to say?',
-        'title': 'The High Priestess (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-high-priestess-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-05.png',
-        'keywords': ['motherhood', 'fertility', 'nature'],
-        'meaning': 'She is the symbol of the feminine principle - a '
-                   'representation of venus and mother earth. She is '
-                   'nurturing, fertile, and a provider. There is '
-                   'something to her that suggests a mother figure as '
-                   'well.',
-        'reading': 'motherhood, fertility, nature\n'
-                   'She is the symbol of the feminine principle - a '
-                   'representation of venus and mother earth. She is '
-                   'nurturing, fertile, and a provider. There is '
-                   'something to her that suggests a mother figure as '
-                   'well.',
-        'title': 'The Empress',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-empress-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-05.png',
-        'keywords': ['dependence', 'smothering', 'emptiness',
-                    'nosiness'],
-        'meaning': 'Though normally the Empress is incredibly '
-                   'nurturing, the dark side of that is that she can '
-                   'also be smothering. Allowing something to grow '
-                   'means also giving it room to explore and expand. '
-                   'What parts of your life could you benefit from '
-                   'letting go?',
-        'reading': 'dependence, smothering, emptiness, nosiness\n'
-                   'Though normally the Empress is incredibly '
-                   'nurturing, the dark side of that is that she can '
-                   'also be smothering. Allowing something to grow '
-                   'means also giving it room to explore and expand. '
-                   'What parts of your life could you benefit from '
-                   'letting go?',
-        'title': 'The Empress (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-empress-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-06.png',
-        'keywords': ['authority', 'structure', 'control', 'fatherhood'],
-        'meaning': 'While the Empress represents the archetypal '
-                   'mother, the Emperor represents the father. He '
-                   'exudes authority - and though he is stern, he is '
-                   'also filled with wisdom and understanding from his '
-                   'years. He signals structure, stability and the '
-                   'rule of thought over the heart.',
-        'reading': 'authority, structure, control, fatherhood\n'
-                   'While the Empress represents the archetypal '
-                   'mother, the Emperor represents the father. He '
-                   'exudes authority - and though he is stern, he is '
-                   'also filled with wisdom and understanding from his '
-                   'years. He signals structure, stability and the '
-                   'rule of thought over the heart.',
-        'title': 'The Emperor',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-emperor-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-06.png',
-        'keywords': ['tyranny', 'rigidity', 'coldness'],
-        'meaning': 'A good emperor not only understands when to take '
-                   'control, but also when the control is too much. In '
-                   'this case, the authority that he exudes has turned '
-                   'to domination, his firm grasp of his kingdom '
-                   'turning into suffering. What parts of yourself '
-                   'could you aim to release?',
-        'reading': 'tyranny, rigidity, coldness\n'
-                   'A good emperor not only understands when to take '
-                   'control, but also when the control is too much. In '
-                   'this case, the authority that he exudes has turned '
-                   'to domination, his firm grasp of his kingdom '
-                   'turning into suffering. What parts of yourself '
-                   'could you aim to release?',
-        'title': 'The Emperor (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-emperor-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-07.png',
-        'keywords': ['tradition', 'conformity', 'morality', 'ethics'],
-        'meaning': 'Following the bounds of tradition. What is tried '
-                   'and true is valued, and it is not the time to '
-                   'stray from the path. This card can also represent '
-                   'the pursuit of knowledge, or a spiritual guide.',
-        'reading': 'tradition, conformity, morality, ethics\n'
-                   'Following the bounds of tradition. What is tried '
-                   'and true is valued, and it is not the time to '
-                   'stray from the path. This card can also represent '
-                   'the pursuit of knowledge, or a spiritual guide.',
-        'title': 'The Hierophant',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hierophant-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-07.png',
-        'keywords': ['rebellion', 'subversiveness', 'new approaches'],
-        'meaning': 'You might be feeling incredibly restricted in your '
-                   'life, and questioning whether the decisions that '
-                   'have been made were made with your true self in '
-                   'mind, or rather what others expect of you. You are '
-                   'considering embarking on the road less taken. Free '
-                   'yourself and diverge from the norms which society '
-                   'expects of you, and pursue a new approach in '
-                   'life. ',
-        'reading': 'rebellion, subversiveness, new approaches\n'
-                   'You might be feeling incredibly restricted in your '
-                   'life, and questioning whether the decisions that '
-                   'have been made were made with your true self in '
-                   'mind, or rather what others expect of you. You are '
-                   'considering embarking on the road less taken. Free '
-                   'yourself and diverge from the norms which society '
-                   'expects of you, and pursue a new approach in '
-                   'life. ',
-        'title': 'The Hierophant (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hierophant-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-08.png',
-        'keywords': ['partnerships', 'duality', 'union'],
-        'meaning': 'A union of harmony, full of trust, confidence and '
-                   'strength. This relationship is one that represents '
-                   'both a physical attraction and a deep emotional '
-                   'bond between them. It can also represent an inner '
-                   "harmony between two aspects of one's personality: "
-                   'anima and animus, yin and yang, and so forth.',
-        'reading': 'partnerships, duality, union\n'
-                   'A union of harmony, full of trust, confidence and '
-                   'strength. This relationship is one that represents '
-                   'both a physical attraction and a deep emotional '
-                   'bond between them. It can also represent an inner '
-                   "harmony between two aspects of one's personality: "
-                   'anima and animus, yin and yang, and so forth.',
-        'title': 'The Lovers',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-lovers-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-08.png',
-        'keywords': ['loss of balance', 'one-sidedness', 'disharmony'],
-        'meaning': 'In a partnership, there may be a sense of feeling '
-                   'like one party is giving or taking too much. Are '
-                   'the feelings in your relationship mutual? Or '
-                   'conversely, there might be disagreements - between '
-                   'either two parts within yourself, or amongst your '
-                   'relationships.',
-        'reading': 'loss of balance, one-sidedness, disharmony\n'
-                   'In a partnership, there may be a sense of feeling '
-                   'like one party is giving or taking too much. Are '
-                   'the feelings in your relationship mutual? Or '
-                   'conversely, there might be disagreements - between '
-                   'either two parts within yourself, or amongst your '
-                   'relationships.',
-        'title': 'The Lovers (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-lovers-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-09.png',
-        'keywords': ['direction', 'control', 'willpower'],
-        'meaning': 'At times, success and victory is the result of '
-                   'pure willpower and self control. To achieve and '
-                   'accomplish what you desire, you must take the '
-                   'reins and harness the chaotic forces that surround '
-                   'you.',
-        'reading': 'direction, control, willpower\n'
-                   'At times, success and victory is the result of '
-                   'pure willpower and self control. To achieve and '
-                   'accomplish what you desire, you must take the '
-                   'reins and harness the chaotic forces that surround '
-                   'you.',
-        'title': 'The Chariot',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-chariot-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-09.png',
-        'keywords': ['lack of control', 'lack of direction',
-                    'aggression'],
-        'meaning': 'Being at the mercy of two opposing forces, '
-                   'constantly battling for domination. There is a '
-                   'sense that you have lost control here, that you '
-                   "are not at the driver's seat, that you are a "
-                   'passive observer. You must begin to understand '
-                   'what it is in your life that you can and cannot '
-                   'drive, and let what you cannot go.',
-        'reading': 'lack of control, lack of direction, aggression\n'
-                   'Being at the mercy of two opposing forces, '
-                   'constantly battling for domination. There is a '
-                   'sense that you have lost control here, that you '
-                   "are not at the driver's seat, that you are a "
-                   'passive observer. You must begin to understand '
-                   'what it is in your life that you can and cannot '
-                   'drive, and let what you cannot go.',
-        'title': 'The Chariot (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-chariot-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-10.png',
-        'keywords': ['inner strength', 'bravery', 'compassion',
-                    'focus'],
-        'meaning': 'A great deal of inner understanding that radiates '
-                   'power. Along with this power, there is also '
-                   'compassion, thus the relationship between the '
-                   'woman and the lion is not of one force, but '
-                   'balance between them.',
-        'reading': 'inner strength, bravery, compassion, focus\n'
-                   'A great deal of inner understanding that radiates '
-                   'power. Along with this power, there is also '
-                   'compassion, thus the relationship between the '
-                   'woman and the lion is not of one force, but '
-                   'balance between them.',
-        'title': 'Strength',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/strength-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-10.png',
-        'keywords': ['self doubt', 'weakness', 'insecurity'],
-        'meaning': 'Recent obstacles have created some insecurity '
-                   'about your abilities. A feeling of not being ready '
-                   'for the challenges that life gives you '
-                   'predominates this reversed card. What parts of '
-                   'yourself are you feeling ashamed of? Although it '
-                   'may be counter-intuitive, acknowledging your '
-                   'vulnerabilities may be a sign of inner strength.',
-        'reading': 'self doubt, weakness, insecurity\n'
-                   'Recent obstacles have created some insecurity '
-                   'about your abilities. A feeling of not being ready '
-                   'for the challenges that life gives you '
-                   'predominates this reversed card. What parts of '
-                   'yourself are you feeling ashamed of? Although it '
-                   'may be counter-intuitive, acknowledging your '
-                   'vulnerabilities may be a sign of inner strength.',
-        'title': 'Strength (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/strength-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-11.png',
-        'keywords': ['contemplation', 'search for truth',
-                    'inner guidance'],
-        'meaning': 'A time for self reflection, this is the soul’s '
-                   'journey inward. The hermit seeks the ultimate '
-                   'truth, and understands that it comes from within '
-                   'and only after a period of self-isolation from the '
-                   'demands of the world.',
-        'reading': 'contemplation, search for truth, inner guidance\n'
-                   'A time for self reflection, this is the soul’s '
-                   'journey inward. The hermit seeks the ultimate '
-                   'truth, and understands that it comes from within '
-                   'and only after a period of self-isolation from the '
-                   'demands of the world.',
-        'title': 'The Hermit',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hermit-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-11.png',
-        'keywords': ['loneliness', 'isolation', 'lost your way'],
-        'meaning': 'Going inward along the path towards the self may '
-                   'bring great rewards, but also has the danger of '
-                   'luring you deeper into the abyss. Your gaze inward '
-                   'has perhaps led to a feeling of disconnection with '
-                   'your fellow man. What can you do to bring the '
-                   'gifts you earned in your solitude outward?',
-        'reading': 'loneliness, isolation, lost your way\n'
-                   'Going inward along the path towards the self may '
-                   'bring great rewards, but also has the danger of '
-                   'luring you deeper into the abyss. Your gaze inward '
-                   'has perhaps led to a feeling of disconnection with '
-                   'your fellow man. What can you do to bring the '
-                   'gifts you earned in your solitude outward?',
-        'title': 'The Hermit (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hermit-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-12.png',
-        'keywords': ['change', 'cycles', 'inevitable fate'],
-        'meaning': 'Greater forces that are outside of human control '
-                   'are at work here. The same forces that govern the '
-                   'changing of the seasons, or the rising and setting '
-                   'of the sun is also the master of luck and the fate '
-                   'of individuals. This card represents the '
-                   "inevitable changing of cycles. It's lesson is: "
-                   "'what comes up must come down.'",
-        'reading': 'change, cycles, inevitable fate\n'
-                   'Greater forces that are outside of human control '
-                   'are at work here. The same forces that govern the '
-                   'changing of the seasons, or the rising and setting '
-                   'of the sun is also the master of luck and the fate '
-                   'of individuals. This card represents the '
-                   "inevitable changing of cycles. It's lesson is: "
-                   "'what comes up must come down.'",
-        'title': 'The Wheel of Fortune',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-wheel-of-fortune-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-12.png',
-        'keywords': ['no control', 'clinging to control', 'bad luck'],
-        'meaning': 'A seemingly unstoppable series of events has '
-                   'occurred, and they are not in your favor. There is '
-                   'a feeling of general bad luck that you cannot '
-                   'control, leaving you in a state of helplessness. '
-                   'The great wheel always turns regardless of human '
-                   'desire, but what comes down will eventually come '
-                   'back up again.',
-        'reading': 'no control, clinging to control, bad luck\n'
-                   'A seemingly unstoppable series of events has '
-                   'occurred, and they are not in your favor. There is '
-                   'a feeling of general bad luck that you cannot '
-                   'control, leaving you in a state of helplessness. '
-                   'The great wheel always turns regardless of human '
-                   'desire, but what comes down will eventually come '
-                   'back up again.',
-        'title': 'The Wheel of Fortune (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-wheel-of-fortune-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-13.png',
-        'keywords': ['cause and effect', 'clarity', 'truth'],
-        'meaning': 'Justice is fairness, truth and the exercise of the '
-                   'law - and this is card of karmic retribution. What '
-                   'you get is a direct result of your actions.',
-        'reading': 'cause and effect, clarity, truth\n'
-                   'Justice is fairness, truth and the exercise of the '
-                   'law - and this is card of karmic retribution. What '
-                   'you get is a direct result of your actions.',
-        'title': 'Justice',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/justice-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-13.png',
-        'keywords': ['dishonesty', 'unaccountability', 'unfairness'],
-        'meaning': 'Justice has turned a blind eye and something that '
-                   'would have normally been met with retribution and '
-                   'punishment has gone unnoticed. Is there a deeper '
-                   'meaning to the events that have happened? What '
-                   'actions and intentions have you been turning a '
-                   'blind eye to?',
-        'reading': 'dishonesty, unaccountability, unfairness\n'
-                   'Justice has turned a blind eye and something that '
-                   'would have normally been met with retribution and '
-                   'punishment has gone unnoticed. Is there a deeper '
-                   'meaning to the events that have happened? What '
-                   'actions and intentions have you been turning a '
-                   'blind eye to?',
-        'title': 'Justice (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/justice-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-14.png',
-        'keywords': ['sacrifice', 'release', 'martyrdom'],
-        'meaning': 'Though the hanged man is swinging upside down, the '
-                   'serenity of his expression seems to communicate '
-                   'that he is doing this of his own free will. The '
-                   'hanged man understands the value of '
-                   'self-sacrifice. One must take a step backward to '
-                   'move ahead.',
-        'reading': 'sacrifice, release, martyrdom\n'
-                   'Though the hanged man is swinging upside down, the '
-                   'serenity of his expression seems to communicate '
-                   'that he is doing this of his own free will. The '
-                   'hanged man understands the value of '
-                   'self-sacrifice. One must take a step backward to '
-                   'move ahead.',
-        'title': 'The Hanged Man',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hanged-man-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-14.png',
-        'keywords': ['stalling', 'needless sacrifice',
-                    'fear of sacrifice'],
-        'meaning': 'To move forwards, one must sometimes take two '
-                   'steps back. You understand this, but there is a '
-                   'sense of hesitation here, you do not want to let '
-                   'go of all that you have achieved. On the other '
-                   'hand, perhaps your sacrifice has already occurred, '
-                   "and you are feeling that it didn't produce the "
-                   'results you thought it would.',
-        'reading': 'stalling, needless sacrifice, fear of sacrifice\n'
-                   'To move forwards, one must sometimes take two '
-                   'steps back. You understand this, but there is a '
-                   'sense of hesitation here, you do not want to let '
-                   'go of all that you have achieved. On the other '
-                   'hand, perhaps your sacrifice has already occurred, '
-                   "and you are feeling that it didn't produce the "
-                   'results you thought it would.',
-        'title': 'The Hanged Man (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-hanged-man-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-15.png',
-        'keywords': ['end of cycle', 'beginnings', 'change',
-                    'metamorphosis'],
-        'meaning': 'A cycle comes to a close, a radical transformation '
-                   'that requires a part of oneself to be sacrificed '
-                   'to be able to continue to the next plane. With '
-                   'loss, something new can begin. Death carries a '
-                   'scythe not just to destroy but also sow the new '
-                   'harvest.',
-        'reading': 'end of cycle, beginnings, change, metamorphosis\n'
-                   'A cycle comes to a close, a radical transformation '
-                   'that requires a part of oneself to be sacrificed '
-                   'to be able to continue to the next plane. With '
-                   'loss, something new can begin. Death carries a '
-                   'scythe not just to destroy but also sow the new '
-                   'harvest.',
-        'title': 'Death',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/death-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-15.png',
-        'keywords': ['fear of change', 'holding on', 'stagnation',
-                    'decay'],
-        'meaning': 'Cycles begin and cycles end, is the message of the '
-                   'Death card. Though it rarely represents actual '
-                   'death, it does propose a radical transformation of '
-                   'some kind. But this change can be hard to swallow, '
-                   'and there is resistance here. You cannot live '
-                   'always in the shadow of the past, but you must '
-                   'embrace new beginnings, and understand that the '
-                   'phoenix rises from the ashes.',
-        'reading': 'fear of change, holding on, stagnation, decay\n'
-                   'Cycles begin and cycles end, is the message of the '
-                   'Death card. Though it rarely represents actual '
-                   'death, it does propose a radical transformation of '
-                   'some kind. But this change can be hard to swallow, '
-                   'and there is resistance here. You cannot live '
-                   'always in the shadow of the past, but you must '
-                   'embrace new beginnings, and understand that the '
-                   'phoenix rises from the ashes.',
-        'title': 'Death (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/death-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-16.png',
-        'keywords': ['middle path', 'patience', 'finding meaning'],
-        'meaning': 'Taking the middle road, finding a balance in life '
-                   'that allows you to attain a sense of calm. When it '
-                   'relates to the external world, it also means '
-                   'adapting, cooperation and mediation.',
-        'reading': 'middle path, patience, finding meaning\n'
-                   'Taking the middle road, finding a balance in life '
-                   'that allows you to attain a sense of calm. When it '
-                   'relates to the external world, it also means '
-                   'adapting, cooperation and mediation.',
-        'title': 'Temperance',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/temperance-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-16.png',
-        'keywords': ['extremes', 'excess', 'lack of balance'],
-        'meaning': 'Too much of anything can lead to ruin. Your focus '
-                   'is sharp and unwavering, but what are you leaving '
-                   'forgotten? Something has been forgotten in your '
-                   'quest for excellence.',
-        'reading': 'extremes, excess, lack of balance\n'
-                   'Too much of anything can lead to ruin. Your focus '
-                   'is sharp and unwavering, but what are you leaving '
-                   'forgotten? Something has been forgotten in your '
-                   'quest for excellence.',
-        'title': 'Temperance (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/temperance-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-17.png',
-        'keywords': ['addiction', 'materialism', 'playfulness'],
-        'meaning': 'Represents the fears, obsessions and insecurities '
-                   'that hold humanity back from reaching their true '
-                   'potential. Two souls are enslaved by the beast, a '
-                   'mirror image to “The Lovers”, but their bonds are '
-                   'not those that are physical or real.',
-        'reading': 'addiction, materialism, playfulness\n'
-                   'Represents the fears, obsessions and insecurities '
-                   'that hold humanity back from reaching their true '
-                   'potential. Two souls are enslaved by the beast, a '
-                   'mirror image to “The Lovers”, but their bonds are '
-                   'not those that are physical or real.',
-        'title': 'The Devil',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-devil-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-17.png',
-        'keywords': ['freedom', 'release', 'restoring control'],
-        'meaning': 'The shadows of codependency, enslavement and debt '
-                   'are being cleared, and an understanding of what is '
-                   "important and what isn't is once again achieved. "
-                   'What are the things that you need to do in order '
-                   'to completely free yourself from your chains?',
-        'reading': 'freedom, release, restoring control\n'
-                   'The shadows of codependency, enslavement and debt '
-                   'are being cleared, and an understanding of what is '
-                   "important and what isn't is once again achieved. "
-                   'What are the things that you need to do in order '
-                   'to completely free yourself from your chains?',
-        'title': 'The Devil (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-devil-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-18.png',
-        'keywords': ['sudden upheaval', 'broken pride', 'disaster'],
-        'meaning': 'Inevitable destruction and the breakdown something '
-                   'in our lives which we consider foundational. '
-                   'Reminiscent of the tower of babel, which was built '
-                   'upon far-reaching human ambition, creating an '
-                   'artificial comfort in our lives. But there is '
-                   'always an upside - when the tower levels, not only '
-                   'do we uncover our own hidden resilience, but we '
-                   'can also rebuild anew, with greater inner insight.',
-        'reading': 'sudden upheaval, broken pride, disaster\n'
-                   'Inevitable destruction and the breakdown something '
-                   'in our lives which we consider foundational. '
-                   'Reminiscent of the tower of babel, which was built '
-                   'upon far-reaching human ambition, creating an '
-                   'artificial comfort in our lives. But there is '
-                   'always an upside - when the tower levels, not only '
-                   'do we uncover our own hidden resilience, but we '
-                   'can also rebuild anew, with greater inner insight.',
-        'title': 'The Tower',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-tower-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-18.png',
-        'keywords': ['disaster avoided', 'delayed disaster',
-                    'fear of suffering'],
-        'meaning': 'An incredibly painful event is on the horizon, you '
-                   'see its approach, but attempt to avoid it at all '
-                   'costs, leaving you in a state of paralysis. But '
-                   'with such pain and destruction, great lessons '
-                   'could come. What are you most fearing that you are '
-                   'trying to keep at bay? What can you learn?',
-        'reading': 'disaster avoided, delayed disaster, fear of '
-                   'suffering\n'
-                   'An incredibly painful event is on the horizon, you '
-                   'see its approach, but attempt to avoid it at all '
-                   'costs, leaving you in a state of paralysis. But '
-                   'with such pain and destruction, great lessons '
-                   'could come. What are you most fearing that you are '
-                   'trying to keep at bay? What can you learn?',
-        'title': 'The Tower (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-tower-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-19.png',
-        'keywords': ['hope', 'faith', 'rejuvenation'],
-        'meaning': 'After the collapse of the tower, the star suggests '
-                   'the possibility for rebirth, rejuvenation, and '
-                   'overall - hope. It is a phase in which one has '
-                   'trust and faith in oneself and in the universe '
-                   'around them.',
-        'reading': 'hope, faith, rejuvenation\n'
-                   'After the collapse of the tower, the star suggests '
-                   'the possibility for rebirth, rejuvenation, and '
-                   'overall - hope. It is a phase in which one has '
-                   'trust and faith in oneself and in the universe '
-                   'around them.',
-        'title': 'The Star',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-star-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-19.png',
-        'keywords': ['faithlessness', 'discouragement', 'insecurity'],
-        'meaning': 'Negativity surrounds your thoughts, you only '
-                   'expect the worst out of your situation. But your '
-                   'perception creates your reality, and you are '
-                   'caught in an endless cycle. If only you could see '
-                   'the positives, you could understand and move '
-                   'forward.',
-        'reading': 'faithlessness, discouragement, insecurity\n'
-                   'Negativity surrounds your thoughts, you only '
-                   'expect the worst out of your situation. But your '
-                   'perception creates your reality, and you are '
-                   'caught in an endless cycle. If only you could see '
-                   'the positives, you could understand and move '
-                   'forward.',
-        'title': 'The Star (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-star-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-20.png',
-        'keywords': ['unconscious', 'illusions', 'intuition'],
-        'meaning': 'Night is the time when dreams and fantasies rule. '
-                   'The moon also represents instincts that we have '
-                   'buried in our own unconscious - they come out to '
-                   'play in the moonlight. But the reflections that we '
-                   'see springing forth can also be illusions, it is '
-                   'easy to lose your way in the dark.',
-        'reading': 'unconscious, illusions, intuition\n'
-                   'Night is the time when dreams and fantasies rule. '
-                   'The moon also represents instincts that we have '
-                   'buried in our own unconscious - they come out to '
-                   'play in the moonlight. But the reflections that we '
-                   'see springing forth can also be illusions, it is '
-                   'easy to lose your way in the dark.',
-        'title': 'The Moon',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-moon-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-20.png',
-        'keywords': ['confusion', 'fear', 'misinterpretation'],
-        'meaning': 'When dreams and fantasies come out to play, it '
-                   'becomes difficult to separate reality from '
-                   'illusion. Confusion reigns supreme here, and there '
-                   'is little understanding of what you can take for '
-                   'as true.',
-        'reading': 'confusion, fear, misinterpretation\n'
-                   'When dreams and fantasies come out to play, it '
-                   'becomes difficult to separate reality from '
-                   'illusion. Confusion reigns supreme here, and there '
-                   'is little understanding of what you can take for '
-                   'as true.',
-        'title': 'The Moon (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-moon-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-21.png',
-        'keywords': ['joy', 'success', 'celebration', 'positivity'],
-        'meaning': 'Symbolizes the success of the conscious mind in '
-                   'overcoming any obstacles or fears of the '
-                   'unconscious, usually through attainment of '
-                   'knowledge.',
-        'reading': 'joy, success, celebration, positivity\n'
-                   'Symbolizes the success of the conscious mind in '
-                   'overcoming any obstacles or fears of the '
-                   'unconscious, usually through attainment of '
-                   'knowledge.',
-        'title': 'The Sun',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-sun-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-21.png',
-        'keywords': ['negativity', 'depression', 'sadness'],
-        'meaning': 'Clouds block out the rays of the sun, and it '
-                   'becomes difficult to be optimistic in your '
-                   'situation. What joys and happinesses are you not '
-                   'seeing that are actually right in front of you?',
-        'reading': 'negativity, depression, sadness\n'
-                   'Clouds block out the rays of the sun, and it '
-                   'becomes difficult to be optimistic in your '
-                   'situation. What joys and happinesses are you not '
-                   'seeing that are actually right in front of you?',
-        'title': 'The Sun (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-sun-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-22.png',
-        'keywords': ['reflection', 'reckoning', 'awakening'],
-        'meaning': 'Judgement indicates the cusp of rebirth. In order '
-                   'to achieve that, you must look back upon your '
-                   'deeds and come to an honest evaluation of '
-                   'yourself. This leads to the awakening that signals '
-                   'a new way of life.',
-        'reading': 'reflection, reckoning, awakening\n'
-                   'Judgement indicates the cusp of rebirth. In order '
-                   'to achieve that, you must look back upon your '
-                   'deeds and come to an honest evaluation of '
-                   'yourself. This leads to the awakening that signals '
-                   'a new way of life.',
-        'title': 'Judgement',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/judgement-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-22.png',
-        'keywords': ['lack of self awareness', 'doubt',
-                    'self loathing'],
-        'meaning': 'Reflecting on yourself, you may not be able to see '
-                   'the full picture, or you might see something that '
-                   "you don't particularly like. Perhaps you are being "
-                   'too harsh on yourself, or unable to see your true '
-                   'worth.',
-        'reading': 'lack of self awareness, doubt, self loathing\n'
-                   'Reflecting on yourself, you may not be able to see '
-                   'the full picture, or you might see something that '
-                   "you don't particularly like. Perhaps you are being "
-                   'too harsh on yourself, or unable to see your true '
-                   'worth.',
-        'title': 'Judgement (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/judgement-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-23.png',
-        'keywords': ['fulfillment', 'harmony', 'completion'],
-        'meaning': 'Absolute unity, perfection, accomplishment that '
-                   'draws from inner and outer sources. This card '
-                   'signals the harmony of the inner and outer worlds, '
-                   'and reaching a level of enlightenment. An era of '
-                   'one’s life is complete, and there is joy and '
-                   'celebration that is coming to welcome it.',
-        'reading': 'fulfillment, harmony, completion\n'
-                   'Absolute unity, perfection, accomplishment that '
-                   'draws from inner and outer sources. This card '
-                   'signals the harmony of the inner and outer worlds, '
-                   'and reaching a level of enlightenment. An era of '
-                   'one’s life is complete, and there is joy and '
-                   'celebration that is coming to welcome it.',
-        'title': 'The World',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-world-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/major-23.png',
-        'keywords': ['incompletion', 'no closure'],
-        'meaning': 'Nearing the end of your journey, you are close to '
-                   'accomplishing all that you have set out to '
-                   'achieve, but something stands in your way of being '
-                   'able to celebrate. At the last second, something '
-                   'has been left undone, and it leaves you with a '
-                   'feeling of emptiness. What pieces do you need to '
-                   'have in place to have closure?',
-        'reading': 'incompletion, no closure\n'
-                   'Nearing the end of your journey, you are close to '
-                   'accomplishing all that you have set out to '
-                   'achieve, but something stands in your way of being '
-                   'able to celebrate. At the last second, something '
-                   'has been left undone, and it leaves you with a '
-                   'feeling of emptiness. What pieces do you need to '
-                   'have in place to have closure?',
-        'title': 'The World (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/the-world-meaning-major-arcana-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-66.png',
-        'keywords': ['ambition', 'desire', 'diligence'],
-        'meaning': 'This card indicates that you are on the brink of '
-                   'giving life to a new venture or opportunity that '
-                   'brings you luck in the material world. You are '
-                   'full of enthusiasm and energy to make this new '
-                   'opportunity come to life.',
-        'reading': 'ambition, desire, diligence\n'
-                   'This card indicates that you are on the brink of '
-                   'giving life to a new venture or opportunity that '
-                   'brings you luck in the material world. You are '
-                   'full of enthusiasm and energy to make this new '
-                   'opportunity come to life.',
-        'title': 'Page of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-66.png',
-        'keywords': ['lack of commitment', 'greediness', 'laziness'],
-        'meaning': 'With this card reversed, your enthusiasm in '
-                   'starting your new venture has perhaps tapered off. '
-                   'You find yourself lost amongst the clouds in '
-                   'daydreaming, and not coming to any practical '
-                   'action.',
-        'reading': 'lack of commitment, greediness, laziness\n'
-                   'With this card reversed, your enthusiasm in '
-                   'starting your new venture has perhaps tapered off. '
-                   'You find yourself lost amongst the clouds in '
-                   'daydreaming, and not coming to any practical '
-                   'action.',
-        'title': 'Page of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-67.png',
-        'keywords': ['efficiency', 'hard work', 'responsibility'],
-        'meaning': 'A man of utmost diligence - he knows what he wants '
-                   'and is relentless in his pursuit of it. He is a '
-                   'hard worker, completing his mission with complete '
-                   'and terrible efficiency. Although his path is long '
-                   'and hard, filled with tasks that might be '
-                   'repetitive and tiring, giving up is not an option.',
-        'reading': 'efficiency, hard work, responsibility\n'
-                   'A man of utmost diligence - he knows what he wants '
-                   'and is relentless in his pursuit of it. He is a '
-                   'hard worker, completing his mission with complete '
-                   'and terrible efficiency. Although his path is long '
-                   'and hard, filled with tasks that might be '
-                   'repetitive and tiring, giving up is not an option.',
-        'title': 'Knight of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-67.png',
-        'keywords': ['laziness', 'obsessiveness',
-                    'work without reward'],
-        'meaning': 'Though efficiency and hard work can be incredibly '
-                   'fulfilling, it can also detract you from seeing '
-                   'the bigger picture. What are you giving up so that '
-                   'you can accomplish your goals? Is it worth it all? '
-                   'On the other hand, have you been feeling stuck, or '
-                   "that the work that you have been putting in hasn't "
-                   'yielded all that you have hoped for?',
-        'reading': 'laziness, obsessiveness, work without reward\n'
-                   'Though efficiency and hard work can be incredibly '
-                   'fulfilling, it can also detract you from seeing '
-                   'the bigger picture. What are you giving up so that '
-                   'you can accomplish your goals? Is it worth it all? '
-                   'On the other hand, have you been feeling stuck, or '
-                   "that the work that you have been putting in hasn't "
-                   'yielded all that you have hoped for?',
-        'title': 'Knight of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-68.png',
-        'keywords': ['practicality', 'creature comforts',
-                    'financial security'],
-        'meaning': 'A woman that is blessed with the gifts of sensual '
-                   'comforts and domestic talents. A motherly figure '
-                   'at times, she seeks to bring to her loved ones joy '
-                   'through all things that are worldly - by cooking, '
-                   'cleaning and creating a wonderful home.',
-        'reading': 'practicality, creature comforts, financial '
-                   'security\n'
-                   'A woman that is blessed with the gifts of sensual '
-                   'comforts and domestic talents. A motherly figure '
-                   'at times, she seeks to bring to her loved ones joy '
-                   'through all things that are worldly - by cooking, '
-                   'cleaning and creating a wonderful home.',
-        'title': 'Queen of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-68.png',
-        'keywords': ['self-centeredness', 'jealousy', 'smothering'],
-        'meaning': 'There is some friction here between your needs at '
-                   'work and your needs at home. You may find yourself '
-                   'in a position where you cannot give enough to '
-                   'either, and you are being pulled in many different '
-                   'directions. You need to think about rebalancing '
-                   'your needs, and the needs of your household.',
-        'reading': 'self-centeredness, jealousy, smothering\n'
-                   'There is some friction here between your needs at '
-                   'work and your needs at home. You may find yourself '
-                   'in a position where you cannot give enough to '
-                   'either, and you are being pulled in many different '
-                   'directions. You need to think about rebalancing '
-                   'your needs, and the needs of your household.',
-        'title': 'Queen of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-69.png',
-        'keywords': ['abundance', 'prosperity', 'security'],
-        'meaning': 'The fruits of worldly ambition have brought '
-                   'financial success, a sense of abundance, stability '
-                   'and security. The King of Pentacles is a fatherly '
-                   'figure that provides all of those things, and is '
-                   'also someone that is happy to share all that he '
-                   'has accumulated.',
-        'reading': 'abundance, prosperity, security\n'
-                   'The fruits of worldly ambition have brought '
-                   'financial success, a sense of abundance, stability '
-                   'and security. The King of Pentacles is a fatherly '
-                   'figure that provides all of those things, and is '
-                   'also someone that is happy to share all that he '
-                   'has accumulated.',
-        'title': 'King of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-69.png',
-        'keywords': ['greed', 'indulgence', 'sensuality'],
-        'meaning': 'With financial success, also comes more '
-                   'temptation. In what kind of ways do you find '
-                   'yourself indulging? There is a sense here of '
-                   'having an infinite desire for things, for '
-                   'consumption, while higher callings are being laid '
-                   'at the wayside.',
-        'reading': 'greed, indulgence, sensuality\n'
-                   'With financial success, also comes more '
-                   'temptation. In what kind of ways do you find '
-                   'yourself indulging? There is a sense here of '
-                   'having an infinite desire for things, for '
-                   'consumption, while higher callings are being laid '
-                   'at the wayside.',
-        'title': 'King of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-70.png',
-        'keywords': ['opportunity', 'prosperity', 'new venture'],
-        'meaning': 'This card represents the spark of new opportunity '
-                   'in the realms of all that is earthly: matter, '
-                   'body, and even wealth. The world brought forth by '
-                   'this card is fertile, and full of abundance '
-                   'bringing opportunity for prosperity.',
-        'reading': 'opportunity, prosperity, new venture\n'
-                   'This card represents the spark of new opportunity '
-                   'in the realms of all that is earthly: matter, '
-                   'body, and even wealth. The world brought forth by '
-                   'this card is fertile, and full of abundance '
-                   'bringing opportunity for prosperity.',
-        'title': 'Ace of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-70.png',
-        'keywords': ['lost opportunity', 'missed chance',
-                    'bad investment'],
-        'meaning': 'While the potential is there for a new venture or '
-                   'opportunity, you are either being blocked from '
-                   'fulfilling that potential or you have lost the '
-                   'opportunity to make something yield.',
-        'reading': 'lost opportunity, missed chance, bad investment\n'
-                   'While the potential is there for a new venture or '
-                   'opportunity, you are either being blocked from '
-                   'fulfilling that potential or you have lost the '
-                   'opportunity to make something yield.',
-        'title': 'Ace of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-71.png',
-        'keywords': ['balancing decisions', 'priorities',
-                    'adapting to change'],
-        'meaning': 'A game of balance is what is at work here. This '
-                   'card gives the sense that rapid change has become '
-                   'a norm in your situation. Having to deal with '
-                   'opposing forces is unavoidable in certain '
-                   "circumstances, but luckily, you've had the "
-                   'resilience to be able to deal with them.',
-        'reading': 'balancing decisions, priorities, adapting to '
-                   'change\n'
-                   'A game of balance is what is at work here. This '
-                   'card gives the sense that rapid change has become '
-                   'a norm in your situation. Having to deal with '
-                   'opposing forces is unavoidable in certain '
-                   "circumstances, but luckily, you've had the "
-                   'resilience to be able to deal with them.',
-        'title': 'II of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-71.png',
-        'keywords': ['loss of balance', 'disorganized', 'overwhelmed'],
-        'meaning': 'There are times when life throws you many many '
-                   'curve balls at one time. You find it difficult to '
-                   'juggle all of the sudden changes that are coming '
-                   'your way. It is likely that in order to deal with '
-                   'these new events, you are neglecting something '
-                   'critical in your life. What can you do to regain '
-                   'balance?',
-        'reading': 'loss of balance, disorganized, overwhelmed\n'
-                   'There are times when life throws you many many '
-                   'curve balls at one time. You find it difficult to '
-                   'juggle all of the sudden changes that are coming '
-                   'your way. It is likely that in order to deal with '
-                   'these new events, you are neglecting something '
-                   'critical in your life. What can you do to regain '
-                   'balance?',
-        'title': 'II of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-72.png',
-        'keywords': ['teamwork', 'collaboration', 'building'],
-        'meaning': 'Several people of vastly varying skills and '
-                   'beliefs work together to join in on a greater '
-                   'cause. Teamwork helps to create something new. '
-                   'Progress is swift.',
-        'reading': 'teamwork, collaboration, building\n'
-                   'Several people of vastly varying skills and '
-                   'beliefs work together to join in on a greater '
-                   'cause. Teamwork helps to create something new. '
-                   'Progress is swift.',
-        'title': 'III of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-72.png',
-        'keywords': ['lack of teamwork', 'disorganized',
-                    'group conflict'],
-        'meaning': 'Missing camaraderie and collaboration is '
-                   'highlighted here. Where you should be working '
-                   'together for the service of a greater good, there '
-                   'seems to be some disorganization or self-interest '
-                   'that is getting in the way.',
-        'reading': 'lack of teamwork, disorganized, group conflict\n'
-                   'Missing camaraderie and collaboration is '
-                   'highlighted here. Where you should be working '
-                   'together for the service of a greater good, there '
-                   'seems to be some disorganization or self-interest '
-                   'that is getting in the way.',
-        'title': 'III of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-73.png',
-        'keywords': ['conservation', 'frugality', 'security'],
-        'meaning': 'Vast wealth has been accumulated here, and as a '
-                   'result, you have become protective of what you '
-                   'have earned. Though some amount of conservatism is '
-                   "good for one's feeling of stability, this card can "
-                   'also warn of stinginess, and having a miserly '
-                   'attitude.',
-        'reading': 'conservation, frugality, security\n'
-                   'Vast wealth has been accumulated here, and as a '
-                   'result, you have become protective of what you '
-                   'have earned. Though some amount of conservatism is '
-                   "good for one's feeling of stability, this card can "
-                   'also warn of stinginess, and having a miserly '
-                   'attitude.',
-        'title': 'IV of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-73.png',
-        'keywords': ['greediness', 'stinginess', 'possessiveness'],
-        'meaning': 'While being conservative can be incredibly '
-                   'beneficial, beware that it does not turn into '
-                   'stinginess. Your fear of loss could lead to '
-                   'hoarding and a fixation upon material things in '
-                   'life. What is the basis of your trying to keep '
-                   'such tight control?',
-        'reading': 'greediness, stinginess, possessiveness\n'
-                   'While being conservative can be incredibly '
-                   'beneficial, beware that it does not turn into '
-                   'stinginess. Your fear of loss could lead to '
-                   'hoarding and a fixation upon material things in '
-                   'life. What is the basis of your trying to keep '
-                   'such tight control?',
-        'title': 'IV of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-74.png',
-        'keywords': ['need', 'poverty', 'insecurity'],
-        'meaning': 'A time of need and desperation. Sometimes signals '
-                   'difficulties with one’s relationship to money. But '
-                   'this card also signals that there is help '
-                   'available if one chooses only to see and '
-                   'acknowledge it.',
-        'reading': 'need, poverty, insecurity\n'
-                   'A time of need and desperation. Sometimes signals '
-                   'difficulties with one’s relationship to money. But '
-                   'this card also signals that there is help '
-                   'available if one chooses only to see and '
-                   'acknowledge it.',
-        'title': 'V of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-74.png',
-        'keywords': ['recovery', 'charity', 'improvement'],
-        'meaning': 'The scarcity that is normally marked by this card '
-                   'is beginning to fade away. There is a sense that '
-                   'you are just beginning to recover from what you '
-                   'feel like you were lacking. You are seeing the '
-                   'chances around you that can use.',
-        'reading': 'recovery, charity, improvement\n'
-                   'The scarcity that is normally marked by this card '
-                   'is beginning to fade away. There is a sense that '
-                   'you are just beginning to recover from what you '
-                   'feel like you were lacking. You are seeing the '
-                   'chances around you that can use.',
-        'title': 'V of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-75.png',
-        'keywords': ['charity', 'generosity', 'sharing'],
-        'meaning': 'Compassion and understanding breeds generosity, '
-                   'sharing and charity. One gives away the fruits of '
-                   'one’s labors with the understanding that the '
-                   'situation of having the upper hand can be reversed '
-                   'at any moment.',
-        'reading': 'charity, generosity, sharing\n'
-                   'Compassion and understanding breeds generosity, '
-                   'sharing and charity. One gives away the fruits of '
-                   'one’s labors with the understanding that the '
-                   'situation of having the upper hand can be reversed '
-                   'at any moment.',
-        'title': 'VI of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-75.png',
-        'keywords': ['strings attached', 'stinginess',
-                    'power and domination'],
-        'meaning': 'Others find themselves in a time of need, but '
-                   'there is unwillingness to lend support to those '
-                   'that need it the most. Alternatively, perhaps you '
-                   'have been giving, but reflect on your intentions '
-                   'for why you do so. What are you trying to gain by '
-                   'such actions?',
-        'reading': 'strings attached, stinginess, power and '
-                   'domination\n'
-                   'Others find themselves in a time of need, but '
-                   'there is unwillingness to lend support to those '
-                   'that need it the most. Alternatively, perhaps you '
-                   'have been giving, but reflect on your intentions '
-                   'for why you do so. What are you trying to gain by '
-                   'such actions?',
-        'title': 'VI of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-76.png',
-        'keywords': ['hard work', 'perseverance', 'diligence'],
-        'meaning': 'An immense amount of work has been done, and the '
-                   'effort that has been put in previously is now '
-                   'ready to be harvested. Though the crop is ready, '
-                   'there is still more work, and it is now a time of '
-                   'focus and diligence before one can reap the '
-                   'rewards. ',
-        'reading': 'hard work, perseverance, diligence\n'
-                   'An immense amount of work has been done, and the '
-                   'effort that has been put in previously is now '
-                   'ready to be harvested. Though the crop is ready, '
-                   'there is still more work, and it is now a time of '
-                   'focus and diligence before one can reap the '
-                   'rewards. ',
-        'title': 'VII of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-76.png',
-        'keywords': ['work without results', 'distractions',
-                    'lack of rewards'],
-        'meaning': 'Though you have definitely been putting in much '
-                   'work, you find yourself questioning whether the '
-                   'rewards that you get from it are enough to justify '
-                   "your time spent. What you've planted perhaps has "
-                   'not taken root, and you find yourself frustrated, '
-                   'and looking for other opportunities.',
-        'reading': 'work without results, distractions, lack of '
-                   'rewards\n'
-                   'Though you have definitely been putting in much '
-                   'work, you find yourself questioning whether the '
-                   'rewards that you get from it are enough to justify '
-                   "your time spent. What you've planted perhaps has "
-                   'not taken root, and you find yourself frustrated, '
-                   'and looking for other opportunities.',
-        'title': 'VII of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-77.png',
-        'keywords': ['apprenticeship', 'passion', 'high standards'],
-        'meaning': 'This card stresses the importance of hard work and '
-                   'diligence in accomplishing your goals. It '
-                   'indicates a time to buckle down, study, achieve '
-                   'new skills all in the name of being able to change '
-                   'your circumstances.',
-        'reading': 'apprenticeship, passion, high standards\n'
-                   'This card stresses the importance of hard work and '
-                   'diligence in accomplishing your goals. It '
-                   'indicates a time to buckle down, study, achieve '
-                   'new skills all in the name of being able to change '
-                   'your circumstances.',
-        'title': 'VIII of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-77.png',
-        'keywords': ['lack of passion', 'uninspired', 'no motivation'],
-        'meaning': 'For one reason or another, you find yourself in a '
-                   'state where you lack the ambition or motivation to '
-                   'move forward with tasks diligently. Hard work is '
-                   'necessary in order to achieve your aims, but you '
-                   'are losing focus by being caught up in the mundane '
-                   'day to day. What can you do in order to think and '
-                   'act more carefully for the future?',
-        'reading': 'lack of passion, uninspired, no motivation\n'
-                   'For one reason or another, you find yourself in a '
-                   'state where you lack the ambition or motivation to '
-                   'move forward with tasks diligently. Hard work is '
-                   'necessary in order to achieve your aims, but you '
-                   'are losing focus by being caught up in the mundane '
-                   'day to day. What can you do in order to think and '
-                   'act more carefully for the future?',
-        'title': 'VIII of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-78.png',
-        'keywords': ['fruits of labor', 'rewards', 'luxury'],
-        'meaning': 'After much hard work, this card indicates a time '
-                   'of opulence and luxury, all resulting in a feeling '
-                   'of satisfaction, emotional comfort and peace. All '
-                   'of this is due to one’s intelligence and '
-                   'self-control and represents an achievement that '
-                   'has lasted over a lifetime.',
-        'reading': 'fruits of labor, rewards, luxury\n'
-                   'After much hard work, this card indicates a time '
-                   'of opulence and luxury, all resulting in a feeling '
-                   'of satisfaction, emotional comfort and peace. All '
-                   'of this is due to one’s intelligence and '
-                   'self-control and represents an achievement that '
-                   'has lasted over a lifetime.',
-        'title': 'IX of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-78.png',
-        'keywords': ['reckless spending', 'living beyond means',
-                    'false success'],
-        'meaning': 'Though you have perhaps spent much of your '
-                   'energies working hard, you might find yourself in '
-                   'a position where setbacks and mistakes have '
-                   'blocked your way to your goals. Though you have '
-                   'not been lacking in will, diligence, or ambition, '
-                   'these mistakes have cost you. Where did you go '
-                   'wrong? What can you do next time so that this does '
-                   'not repeat itself?',
-        'reading': 'reckless spending, living beyond means, false '
-                   'success\n'
-                   'Though you have perhaps spent much of your '
-                   'energies working hard, you might find yourself in '
-                   'a position where setbacks and mistakes have '
-                   'blocked your way to your goals. Though you have '
-                   'not been lacking in will, diligence, or ambition, '
-                   'these mistakes have cost you. Where did you go '
-                   'wrong? What can you do next time so that this does '
-                   'not repeat itself?',
-        'title': 'IX of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-79.png',
-        'keywords': ['legacy', 'culmination', 'inheritance'],
-        'meaning': 'Represents the culmination of life’s journeys. '
-                   'There’s a sense of fulfillment that usually '
-                   'results from hard work in all of life’s facets. '
-                   'This is the end of the path, and it is full of '
-                   'joy.',
-        'reading': 'legacy, culmination, inheritance\n'
-                   'Represents the culmination of life’s journeys. '
-                   'There’s a sense of fulfillment that usually '
-                   'results from hard work in all of life’s facets. '
-                   'This is the end of the path, and it is full of '
-                   'joy.',
-        'title': 'X of Pentacles',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/pentacles-79.png',
-        'keywords': ['fleeting success', 'lack of stability',
-                    'lack of resources'],
-        'meaning': 'Where you should have found riches, rewards and '
-                   'honor for yourself at the final steps of your '
-                   'path, you are instead feeling as though you do not '
-                   'have much to show for the amount of effort that '
-                   'you put in. Your expectations are perhaps shaping '
-                   'this belief - what parts of this picture do you '
-                   'consider unrealistic? Do you believe that your '
-                   'journey is worth the long-term investment?',
-        'reading': 'fleeting success, lack of stability, lack of '
-                   'resources\n'
-                   'Where you should have found riches, rewards and '
-                   'honor for yourself at the final steps of your '
-                   'path, you are instead feeling as though you do not '
-                   'have much to show for the amount of effort that '
-                   'you put in. Your expectations are perhaps shaping '
-                   'this belief - what parts of this picture do you '
-                   'consider unrealistic? Do you believe that your '
-                   'journey is worth the long-term investment?',
-        'title': 'X of Pentacles (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-pentacles-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-52.png',
-        'keywords': ['curiosity', 'restlessness', 'mental energy'],
-        'meaning': 'The page of swords represents someone embarking on '
-                   'a new idea and a mental adventure. Full of '
-                   'enthusiasm and good cheer, this person is eager to '
-                   'share and discuss their thoughts and plans for '
-                   'what can be.',
-        'reading': 'curiosity, restlessness, mental energy\n'
-                   'The page of swords represents someone embarking on '
-                   'a new idea and a mental adventure. Full of '
-                   'enthusiasm and good cheer, this person is eager to '
-                   'share and discuss their thoughts and plans for '
-                   'what can be.',
-        'title': 'Page of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-52.png',
-        'keywords': ['deception', 'manipulation', 'all talk'],
-        'meaning': 'Your enthusiasm and energy has turned you into a '
-                   'bit of an annoyance. There is the chance that you '
-                   'have perhaps been so excited to create or do '
-                   'something that you have planned poorly, leading to '
-                   'setbacks. Alternatively, your promises have not '
-                   'lived up to expectations and there is a sense of '
-                   'disappointment setting in around you.',
-        'reading': 'deception, manipulation, all talk\n'
-                   'Your enthusiasm and energy has turned you into a '
-                   'bit of an annoyance. There is the chance that you '
-                   'have perhaps been so excited to create or do '
-                   'something that you have planned poorly, leading to '
-                   'setbacks. Alternatively, your promises have not '
-                   'lived up to expectations and there is a sense of '
-                   'disappointment setting in around you.',
-        'title': 'Page of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-53.png',
-        'keywords': ['action', 'impulsiveness', 'defending beliefs'],
-        'meaning': 'The power of an idea to overwhelm is represented '
-                   'by the Knight of Swords. Filled with the vision of '
-                   'an idea, he is propelled forward with unbridled '
-                   'ambition. Though his energy is great, there is '
-                   'also a warning associated with being unconscious '
-                   'about consequences and obstacles.',
-        'reading': 'action, impulsiveness, defending beliefs\n'
-                   'The power of an idea to overwhelm is represented '
-                   'by the Knight of Swords. Filled with the vision of '
-                   'an idea, he is propelled forward with unbridled '
-                   'ambition. Though his energy is great, there is '
-                   'also a warning associated with being unconscious '
-                   'about consequences and obstacles.',
-        'title': 'Knight of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-53.png',
-        'keywords': ['no direction', 'disregard for consequences',
-                    'unpredictability'],
-        'meaning': 'Though you are exuberant and it is difficult to '
-                   'match the excitement you have, your desire to act, '
-                   'and to achieve your ambitions have lead you to '
-                   'lose focus, and therefore scatter your energies '
-                   'without a coherent plan. You are not taking into '
-                   'account the consequences that your actions could '
-                   'lead to, meaning that danger could very much lie '
-                   'ahead.',
-        'reading': 'no direction, disregard for consequences, '
-                   'unpredictability\n'
-                   'Though you are exuberant and it is difficult to '
-                   'match the excitement you have, your desire to act, '
-                   'and to achieve your ambitions have lead you to '
-                   'lose focus, and therefore scatter your energies '
-                   'without a coherent plan. You are not taking into '
-                   'account the consequences that your actions could '
-                   'lead to, meaning that danger could very much lie '
-                   'ahead.',
-        'title': 'Knight of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-54.png',
-        'keywords': ['complexity', 'perceptiveness',
-                    'clear mindedness'],
-        'meaning': 'A woman of immense complexity, sometimes '
-                   'considered cold-hearted, but also sharp of mind '
-                   'and wit, independent and possessing great powers '
-                   'of organization and analysis.',
-        'reading': 'complexity, perceptiveness, clear mindedness\n'
-                   'A woman of immense complexity, sometimes '
-                   'considered cold-hearted, but also sharp of mind '
-                   'and wit, independent and possessing great powers '
-                   'of organization and analysis.',
-        'title': 'Queen of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-54.png',
-        'keywords': ['cold hearted', 'cruel', 'bitterness'],
-        'meaning': 'This woman has the potential to be both incredibly '
-                   'wise, perceptive and sharp, but also leans more '
-                   'towards cold-heartedness, and cruelty if given the '
-                   'chance. Her single-minded focus is piercing, but '
-                   'also leaves others by the wayside.',
-        'reading': 'cold hearted, cruel, bitterness\n'
-                   'This woman has the potential to be both incredibly '
-                   'wise, perceptive and sharp, but also leans more '
-                   'towards cold-heartedness, and cruelty if given the '
-                   'chance. Her single-minded focus is piercing, but '
-                   'also leaves others by the wayside.',
-        'title': 'Queen of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-55.png',
-        'keywords': ['head over heart', 'discipline', 'truth'],
-        'meaning': 'With a sharp intellect and clarity of mind, the '
-                   'King of Swords is a representative of truth and '
-                   'its authority. He cuts through deception and is '
-                   'able to rule with a stern and calm intellect. He '
-                   'serves as an incorruptible pillar of strength '
-                   'through his calm of mind.',
-        'reading': 'head over heart, discipline, truth\n'
-                   'With a sharp intellect and clarity of mind, the '
-                   'King of Swords is a representative of truth and '
-                   'its authority. He cuts through deception and is '
-                   'able to rule with a stern and calm intellect. He '
-                   'serves as an incorruptible pillar of strength '
-                   'through his calm of mind.',
-        'title': 'King of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-55.png',
-        'keywords': ['manipulative', 'cruel', 'weakness'],
-        'meaning': 'When the King of Swords reveals his bad side, his '
-                   'usual strength, authority and power in thoughts '
-                   'and words becomes used to hurt and deceive. With '
-                   'his gifts, he persuades and manipulates for his '
-                   'own selfish aims.',
-        'reading': 'manipulative, cruel, weakness\n'
-                   'When the King of Swords reveals his bad side, his '
-                   'usual strength, authority and power in thoughts '
-                   'and words becomes used to hurt and deceive. With '
-                   'his gifts, he persuades and manipulates for his '
-                   'own selfish aims.',
-        'title': 'King of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-56.png',
-        'keywords': ['rest', 'restoration', 'contemplation'],
-        'meaning': 'Rest after a period of intense struggle and '
-                   'heartbreak. Much has been lost recently, but this '
-                   'card indicates that one is in recovery from that '
-                   'challenge. The message being conveyed here is that '
-                   'in order to move forward and rejoin life, we must '
-                   'pause and look within.',
-        'reading': 'rest, restoration, contemplation\n'
-                   'Rest after a period of intense struggle and '
-                   'heartbreak. Much has been lost recently, but this '
-                   'card indicates that one is in recovery from that '
-                   'challenge. The message being conveyed here is that '
-                   'in order to move forward and rejoin life, we must '
-                   'pause and look within.',
-        'title': 'IV of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-56.png',
-        'keywords': ['restlessness', 'burnout', 'stress'],
-        'meaning': "All of life's struggles have been hard on you, and "
-                   'yet you continue to push forwards without giving '
-                   'your body and spirit time to rest and recover from '
-                   'the challenges. Not allowing life to defeat you is '
-                   'important, but it is also important to take a '
-                   'moment of peace, so you can move with more energy '
-                   'for the days to come.',
-        'reading': 'restlessness, burnout, stress\n'
-                   "All of life's struggles have been hard on you, and "
-                   'yet you continue to push forwards without giving '
-                   'your body and spirit time to rest and recover from '
-                   'the challenges. Not allowing life to defeat you is '
-                   'important, but it is also important to take a '
-                   'moment of peace, so you can move with more energy '
-                   'for the days to come.',
-        'title': 'IV of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-57.png',
-        'keywords': ['heartbreak', 'suffering', 'grief'],
-        'meaning': 'Suffering and heartbreak stemming from loneliness, '
-                   'rejection and betrayal. This card indicates a '
-                   'period of intense suffering. Moments like this are '
-                   'sometimes required in life in order to bring out '
-                   'the strength we never knew we had within us.',
-        'reading': 'heartbreak, suffering, grief\n'
-                   'Suffering and heartbreak stemming from loneliness, '
-                   'rejection and betrayal. This card indicates a '
-                   'period of intense suffering. Moments like this are '
-                   'sometimes required in life in order to bring out '
-                   'the strength we never knew we had within us.',
-        'title': 'III of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-57.png',
-        'keywords': ['recovery', 'forgiveness', 'moving on'],
-        'meaning': 'Pain and Suffering has been following you in your '
-                   'life, though you are now in a state where you are '
-                   'cultivating hope and looking towards the future. '
-                   'Though others have done you wrong, you have chosen '
-                   'with great strength to forgive and continue on '
-                   'with your life.',
-        'reading': 'recovery, forgiveness, moving on\n'
-                   'Pain and Suffering has been following you in your '
-                   'life, though you are now in a state where you are '
-                   'cultivating hope and looking towards the future. '
-                   'Though others have done you wrong, you have chosen '
-                   'with great strength to forgive and continue on '
-                   'with your life.',
-        'title': 'III of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-58.png',
-        'keywords': ['difficult choices', 'indecision', 'stalemate'],
-        'meaning': 'Being at a crossroads, this is a moment when you '
-                   'must make a difficult choice. One path closes the '
-                   'other and your decision is hanging in a perfect '
-                   'equilibrium and balance, making the choice ever '
-                   'more difficult. There is no clear winner, but to '
-                   'progress, one must take a stand.',
-        'reading': 'difficult choices, indecision, stalemate\n'
-                   'Being at a crossroads, this is a moment when you '
-                   'must make a difficult choice. One path closes the '
-                   'other and your decision is hanging in a perfect '
-                   'equilibrium and balance, making the choice ever '
-                   'more difficult. There is no clear winner, but to '
-                   'progress, one must take a stand.',
-        'title': 'II of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-58.png',
-        'keywords': ['lesser of two evils', 'no right choice',
-                    'confusion'],
-        'meaning': 'The choices that you need to make right now are '
-                   'ones where there are consequences for both. Though '
-                   'you struggle to weigh the options in your hands, '
-                   'anything you do could lead to suffering. The '
-                   'alternative is that you are wading through '
-                   'conflicting opinions from too many external '
-                   'sources, having to play middle man between 2 '
-                   'opposing forces.',
-        'reading': 'lesser of two evils, no right choice, confusion\n'
-                   'The choices that you need to make right now are '
-                   'ones where there are consequences for both. Though '
-                   'you struggle to weigh the options in your hands, '
-                   'anything you do could lead to suffering. The '
-                   'alternative is that you are wading through '
-                   'conflicting opinions from too many external '
-                   'sources, having to play middle man between 2 '
-                   'opposing forces.',
-        'title': 'II of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-59.png',
-        'keywords': ['breakthrough', 'clarity', 'sharp mind'],
-        'meaning': 'The potential for immense power and success. But '
-                   'remember that the sword is double-edged - '
-                   'depending on who wields it, its power can be used '
-                   'to shelter and protect or to mercilessly strike '
-                   'down for cold and ruthless self-gain.',
-        'reading': 'breakthrough, clarity, sharp mind\n'
-                   'The potential for immense power and success. But '
-                   'remember that the sword is double-edged - '
-                   'depending on who wields it, its power can be used '
-                   'to shelter and protect or to mercilessly strike '
-                   'down for cold and ruthless self-gain.',
-        'title': 'Ace of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-59.png',
-        'keywords': ['confusion', 'brutality', 'chaos'],
-        'meaning': 'You wield incredible power in your hands, but you '
-                   'have perhaps chosen to use it for less than '
-                   'admirable intentions. Alternatively, you are '
-                   'missing critical information that would help you '
-                   'make a clear decision towards what you wish to '
-                   'accomplish.',
-        'reading': 'confusion, brutality, chaos\n'
-                   'You wield incredible power in your hands, but you '
-                   'have perhaps chosen to use it for less than '
-                   'admirable intentions. Alternatively, you are '
-                   'missing critical information that would help you '
-                   'make a clear decision towards what you wish to '
-                   'accomplish.',
-        'title': 'Ace of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-60.png',
-        'keywords': ['unbridled ambition', 'win at all costs',
-                    'sneakiness'],
-        'meaning': 'Victory has been achieved, though it came with a '
-                   'subtle consequence. By taking from your opponents '
-                   'their ability to fight back in some form or '
-                   'fashion, you might have also created resentment. '
-                   'Your actions have isolated you from those who '
-                   'could be helpful later on.',
-        'reading': 'unbridled ambition, win at all costs, sneakiness\n'
-                   'Victory has been achieved, though it came with a '
-                   'subtle consequence. By taking from your opponents '
-                   'their ability to fight back in some form or '
-                   'fashion, you might have also created resentment. '
-                   'Your actions have isolated you from those who '
-                   'could be helpful later on.',
-        'title': 'V of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-60.png',
-        'keywords': ['lingering resentment', 'desire to reconcile',
-                    'forgiveness'],
-        'meaning': 'You have been burdened with a war in which all '
-                   'parties have fought ruthlessly, and where '
-                   'competition was fierce at hand. It has made you '
-                   'exhausted, resentful, and waiting for it to end.',
-        'reading': 'lingering resentment, desire to reconcile, '
-                   'forgiveness\n'
-                   'You have been burdened with a war in which all '
-                   'parties have fought ruthlessly, and where '
-                   'competition was fierce at hand. It has made you '
-                   'exhausted, resentful, and waiting for it to end.',
-        'title': 'V of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-61.png',
-        'keywords': ['transition', 'leaving behind', 'moving on'],
-        'meaning': 'A journey far from home has been initiated by past '
-                   'sorrows. But this journey is something that must '
-                   'be undertaken in order to move ahead. You are '
-                   'leaving a painful place and going into a distant '
-                   'environment that promises more potential.',
-        'reading': 'transition, leaving behind, moving on\n'
-                   'A journey far from home has been initiated by past '
-                   'sorrows. But this journey is something that must '
-                   'be undertaken in order to move ahead. You are '
-                   'leaving a painful place and going into a distant '
-                   'environment that promises more potential.',
-        'title': 'VI of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-61.png',
-        'keywords': ['emotional baggage', 'unresolved issues',
-                    'resisting transition'],
-        'meaning': 'Transition and movement is necessary in life, '
-                   'especially in times when you are leaving something '
-                   'damaging behind. The place you are leaving '
-                   'contains no kindness for you, but you still find '
-                   'it difficult to part ways.',
-        'reading': 'emotional baggage, unresolved issues, resisting '
-                   'transition\n'
-                   'Transition and movement is necessary in life, '
-                   'especially in times when you are leaving something '
-                   'damaging behind. The place you are leaving '
-                   'contains no kindness for you, but you still find '
-                   'it difficult to part ways.',
-        'title': 'VI of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-62.png',
-        'keywords': ['deception', 'trickery', 'tactics and strategy'],
-        'meaning': 'Deception is at work here. You might feel '
-                   'pressured to be dishonest in order to achieve your '
-                   'ambitions, hoping that these lies have gone '
-                   'unnoticed. This card is a warning of how difficult '
-                   'that can be.',
-        'reading': 'deception, trickery, tactics and strategy\n'
-                   'Deception is at work here. You might feel '
-                   'pressured to be dishonest in order to achieve your '
-                   'ambitions, hoping that these lies have gone '
-                   'unnoticed. This card is a warning of how difficult '
-                   'that can be.',
-        'title': 'VII of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-62.png',
-        'keywords': ['coming clean', 'rethinking approach',
-                    'deception'],
-        'meaning': 'Though you may have found yourself in a position '
-                   'where you have needed to lie, betray and steal to '
-                   'survive, there is a spark within you that is '
-                   'showing desire to leave that life behind. It has '
-                   'left you feeling smothered, and unable to be free.',
-        'reading': 'coming clean, rethinking approach, deception\n'
-                   'Though you may have found yourself in a position '
-                   'where you have needed to lie, betray and steal to '
-                   'survive, there is a spark within you that is '
-                   'showing desire to leave that life behind. It has '
-                   'left you feeling smothered, and unable to be free.',
-        'title': 'VII of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-63.png',
-        'keywords': ['imprisonment', 'entrapment',
-                    'self-victimization'],
-        'meaning': 'The woman in the card is restrained and trapped, '
-                   'and indicates that she feels like there is no way '
-                   'out. But these feelings of helplessness are '
-                   'actually one that is caused by a belief in one’s '
-                   'own victimization.',
-        'reading': 'imprisonment, entrapment, self-victimization\n'
-                   'The woman in the card is restrained and trapped, '
-                   'and indicates that she feels like there is no way '
-                   'out. But these feelings of helplessness are '
-                   'actually one that is caused by a belief in one’s '
-                   'own victimization.',
-        'title': 'VIII of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-63.png',
-        'keywords': ['self acceptance', 'new perspective', 'freedom'],
-        'meaning': 'You are moving forward from a time in which you '
-                   'felt trapped and victimized by your own thoughts '
-                   'and perceptions about yourself. You have '
-                   'recognized that your own beliefs may have been '
-                   'your greatest weaknesses.',
-        'reading': 'self acceptance, new perspective, freedom\n'
-                   'You are moving forward from a time in which you '
-                   'felt trapped and victimized by your own thoughts '
-                   'and perceptions about yourself. You have '
-                   'recognized that your own beliefs may have been '
-                   'your greatest weaknesses.',
-        'title': 'VIII of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-64.png',
-        'keywords': ['anxiety', 'hopelessness', 'trauma'],
-        'meaning': 'The nine of swords represents someone that is '
-                   'trapped by their own negative thoughts. There is '
-                   'not necessarily a situation that warrants the '
-                   'worry, and this card hints that over-analysis '
-                   'leads to crippling indecision and feelings of '
-                   'helplessness.',
-        'reading': 'anxiety, hopelessness, trauma\n'
-                   'The nine of swords represents someone that is '
-                   'trapped by their own negative thoughts. There is '
-                   'not necessarily a situation that warrants the '
-                   'worry, and this card hints that over-analysis '
-                   'leads to crippling indecision and feelings of '
-                   'helplessness.',
-        'title': 'IX of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-64.png',
-        'keywords': ['hope', 'reaching out', 'despair'],
-        'meaning': 'It is becoming easy for you to become worked up '
-                   'over the smallest reason. Everything that comes '
-                   'along makes you nervous, sending you into a spiral '
-                   'of negativity. Take a step back and get a clearer '
-                   'perspective.',
-        'reading': 'hope, reaching out, despair\n'
-                   'It is becoming easy for you to become worked up '
-                   'over the smallest reason. Everything that comes '
-                   'along makes you nervous, sending you into a spiral '
-                   'of negativity. Take a step back and get a clearer '
-                   'perspective.',
-        'title': 'IX of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-65.png',
-        'keywords': ['failure', 'collapse', 'defeat'],
-        'meaning': 'Disaster strikes when one least expects it - it is '
-                   'swift and in this case, unavoidable. Something '
-                   'here is beyond your control, leaving you with a '
-                   'feeling that you are a victim of your '
-                   'circumstances.',
-        'reading': 'failure, collapse, defeat\n'
-                   'Disaster strikes when one least expects it - it is '
-                   'swift and in this case, unavoidable. Something '
-                   'here is beyond your control, leaving you with a '
-                   'feeling that you are a victim of your '
-                   'circumstances.',
-        'title': 'X of Swords',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/swords-65.png',
-        'keywords': ["can't get worse", 'only upwards',
-                    'inevitable end'],
-        'meaning': 'Wounds are still fresh, but you have also come to '
-                   'an understanding that the betrayal that you '
-                   'suffered needed to happen in order for you to move '
-                   'forward in some way. It was inevitable, and '
-                   'perhaps you have seen it coming for some time now. '
-                   'What is more important is that you are now focused '
-                   'on recovery.',
-        'reading': "can't get worse, only upwards, inevitable end\n"
-                   'Wounds are still fresh, but you have also come to '
-                   'an understanding that the betrayal that you '
-                   'suffered needed to happen in order for you to move '
-                   'forward in some way. It was inevitable, and '
-                   'perhaps you have seen it coming for some time now. '
-                   'What is more important is that you are now focused '
-                   'on recovery.',
-        'title': 'X of Swords (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-swords-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-24.png',
-        'keywords': ['exploration', 'excitement', 'freedom'],
-        'meaning': 'You are on the brink of a new creative project and '
-                   'vision, there is a spirit of discovery and '
-                   'enthusiasm in all kinds of ideas that you might '
-                   'have about the future. It is the start of a new '
-                   'way of expressing oneself.',
-        'reading': 'exploration, excitement, freedom\n'
-                   'You are on the brink of a new creative project and '
-                   'vision, there is a spirit of discovery and '
-                   'enthusiasm in all kinds of ideas that you might '
-                   'have about the future. It is the start of a new '
-                   'way of expressing oneself.',
-        'title': 'Page of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-24.png',
-        'keywords': ['lack of direction', 'procrastination',
-                    'creating conflict'],
-        'meaning': 'You do not lack passion and desire to create, but '
-                   'for one reason or another, you are finding that '
-                   'your projects have not worked out as you have '
-                   'hoped. Your enthusiasm must also be matched with '
-                   'planning, and execution.',
-        'reading': 'lack of direction, procrastination, creating '
-                   'conflict\n'
-                   'You do not lack passion and desire to create, but '
-                   'for one reason or another, you are finding that '
-                   'your projects have not worked out as you have '
-                   'hoped. Your enthusiasm must also be matched with '
-                   'planning, and execution.',
-        'title': 'Page of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/page-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-25.png',
-        'keywords': ['action', 'adventure', 'fearlessness'],
-        'meaning': 'This person is a man of action - he represents the '
-                   'manifestation of an idea and the passionate '
-                   'pursuit of a vision. Because this person is highly '
-                   'focused on action, he can also be brash, impulsive '
-                   'and unrealistic.',
-        'reading': 'action, adventure, fearlessness\n'
-                   'This person is a man of action - he represents the '
-                   'manifestation of an idea and the passionate '
-                   'pursuit of a vision. Because this person is highly '
-                   'focused on action, he can also be brash, impulsive '
-                   'and unrealistic.',
-        'title': 'Knight of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-25.png',
-        'keywords': ['anger', 'impulsiveness', 'recklessness'],
-        'meaning': 'When you are filled with boundless energy, it can '
-                   'be difficult to run into obstacles that delay your '
-                   'progress forward. Because of the passion that the '
-                   'card represents, the emotion here is one of anger. '
-                   'Looking around for options, you are tempted to act '
-                   'without regard for consequences.',
-        'reading': 'anger, impulsiveness, recklessness\n'
-                   'When you are filled with boundless energy, it can '
-                   'be difficult to run into obstacles that delay your '
-                   'progress forward. Because of the passion that the '
-                   'card represents, the emotion here is one of anger. '
-                   'Looking around for options, you are tempted to act '
-                   'without regard for consequences.',
-        'title': 'Knight of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/knight-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-26.png',
-        'keywords': ['courage', 'determination', 'joy'],
-        'meaning': 'Represents a feminine aspect which is fiery, '
-                   'determined, and strong. Like the other wand suits, '
-                   'she is a natural leader whose courage in the face '
-                   'of adversity is an inspiration to all around her.',
-        'reading': 'courage, determination, joy\n'
-                   'Represents a feminine aspect which is fiery, '
-                   'determined, and strong. Like the other wand suits, '
-                   'she is a natural leader whose courage in the face '
-                   'of adversity is an inspiration to all around her.',
-        'title': 'Queen of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-26.png',
-        'keywords': ['selfishness', 'jealousy', 'insecurities'],
-        'meaning': 'Your are either surrounded by or embodying an '
-                   'aspect that represents all of the negatives of a '
-                   'determined, bold character. What internal '
-                   'insecurities are making you act jealous, angry, or '
-                   'resentful?',
-        'reading': 'selfishness, jealousy, insecurities\n'
-                   'Your are either surrounded by or embodying an '
-                   'aspect that represents all of the negatives of a '
-                   'determined, bold character. What internal '
-                   'insecurities are making you act jealous, angry, or '
-                   'resentful?',
-        'title': 'Queen of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/queen-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-27.png',
-        'keywords': ['big picture', 'leader', 'overcoming challenges'],
-        'meaning': 'A person having great vision and leadership, and '
-                   'all the drive and understanding to create his '
-                   'vision. He leads and inspires others with his '
-                   'unconquerable passion.',
-        'reading': 'big picture, leader, overcoming challenges\n'
-                   'A person having great vision and leadership, and '
-                   'all the drive and understanding to create his '
-                   'vision. He leads and inspires others with his '
-                   'unconquerable passion.',
-        'title': 'King of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-27.png',
-        'keywords': ['impulsive', 'overbearing',
-                    'unachievable expectations'],
-        'meaning': 'When the King of Wands reveals his negative side, '
-                   'he can be anything from domineering, reckless to '
-                   'tyrannical. His visions of what could be might be '
-                   'so grand that they are unrealistic.',
-        'reading': 'impulsive, overbearing, unachievable expectations\n'
-                   'When the King of Wands reveals his negative side, '
-                   'he can be anything from domineering, reckless to '
-                   'tyrannical. His visions of what could be might be '
-                   'so grand that they are unrealistic.',
-        'title': 'King of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/king-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-28.png',
-        'keywords': ['community', 'home', 'celebration'],
-        'meaning': 'A celebration of harmony, happiness and good '
-                   'relationships. It is a time of peace after a '
-                   'period of hard work. The four of wands usually '
-                   'indicates this in regards to family and large '
-                   'groups of people.',
-        'reading': 'community, home, celebration\n'
-                   'A celebration of harmony, happiness and good '
-                   'relationships. It is a time of peace after a '
-                   'period of hard work. The four of wands usually '
-                   'indicates this in regards to family and large '
-                   'groups of people.',
-        'title': 'IV of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-28.png',
-        'keywords': ['lack of support', 'transience', 'home conflicts'],
-        'meaning': 'Breakdowns in communication between your family '
-                   'and friends lead to moments where there is thick '
-                   'tension, and an atmosphere where there no '
-                   'stability. Your home life has therefore been '
-                   'difficult for you.',
-        'reading': 'lack of support, transience, home conflicts\n'
-                   'Breakdowns in communication between your family '
-                   'and friends lead to moments where there is thick '
-                   'tension, and an atmosphere where there no '
-                   'stability. Your home life has therefore been '
-                   'difficult for you.',
-        'title': 'IV of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/four-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-29.png',
-        'keywords': ['looking ahead', 'expansion', 'rapid growth'],
-        'meaning': 'Represents the transformation of dreams into '
-                   'concrete plans and preparation for action. As you '
-                   'look forward to the possible obstacles in your '
-                   'path, you remain dedicated to your pursuit and '
-                   'ready to traverse your boundaries.',
-        'reading': 'looking ahead, expansion, rapid growth\n'
-                   'Represents the transformation of dreams into '
-                   'concrete plans and preparation for action. As you '
-                   'look forward to the possible obstacles in your '
-                   'path, you remain dedicated to your pursuit and '
-                   'ready to traverse your boundaries.',
-        'title': 'III of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-29.png',
-        'keywords': ['obstacles', 'delays', 'frustration'],
-        'meaning': 'Though you have made the plans and are looking '
-                   'towards the far future, you are encountering many '
-                   'obstacles and blockages that you did not expect. '
-                   'Remember that these obstacles are all part of the '
-                   'story that you are meant to tell.',
-        'reading': 'obstacles, delays, frustration\n'
-                   'Though you have made the plans and are looking '
-                   'towards the far future, you are encountering many '
-                   'obstacles and blockages that you did not expect. '
-                   'Remember that these obstacles are all part of the '
-                   'story that you are meant to tell.',
-        'title': 'III of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/three-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-30.png',
-        'keywords': ['planning', 'making decisions', 'leaving home'],
-        'meaning': 'The transformation of vision and ambition into '
-                   'planning and progress. Starting to move into a way '
-                   'forward. The man beholds the material in which he '
-                   'can make his designs come true.',
-        'reading': 'planning, making decisions, leaving home\n'
-                   'The transformation of vision and ambition into '
-                   'planning and progress. Starting to move into a way '
-                   'forward. The man beholds the material in which he '
-                   'can make his designs come true.',
-        'title': 'II of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-30.png',
-        'keywords': ['fear of change', 'playing safe', 'bad planning'],
-        'meaning': 'Your passion and will have propelled you into a '
-                   'stage where you want to begin making plans - but '
-                   'your plans currently are disorganized and you lack '
-                   'key information to progress. Conversely, there may '
-                   'be some fear as you step into the new territories. '
-                   'Remember that the unknown also has a great '
-                   'potential to reward.',
-        'reading': 'fear of change, playing safe, bad planning\n'
-                   'Your passion and will have propelled you into a '
-                   'stage where you want to begin making plans - but '
-                   'your plans currently are disorganized and you lack '
-                   'key information to progress. Conversely, there may '
-                   'be some fear as you step into the new territories. '
-                   'Remember that the unknown also has a great '
-                   'potential to reward.',
-        'title': 'II of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/two-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-31.png',
-        'keywords': ['creation', 'willpower', 'inspiration', 'desire'],
-        'meaning': 'The suit of wands is always the first step in the '
-                   'act of creation. It is the burning fire of '
-                   'intention, desire and passion that ignites the '
-                   'spark of an idea. Thus, this card represents the '
-                   'powerful forces of your will guiding your way like '
-                   'a torch into the world, on a journey to make these '
-                   'desires come to reality.',
-        'reading': 'creation, willpower, inspiration, desire\n'
-                   'The suit of wands is always the first step in the '
-                   'act of creation. It is the burning fire of '
-                   'intention, desire and passion that ignites the '
-                   'spark of an idea. Thus, this card represents the '
-                   'powerful forces of your will guiding your way like '
-                   'a torch into the world, on a journey to make these '
-                   'desires come to reality.',
-        'title': 'Ace of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-31.png',
-        'keywords': ['lack of energy', 'lack of passion', 'boredom'],
-        'meaning': 'When the energy and passion of the Ace of Wands is '
-                   'reversed, it could likely mean that you are '
-                   'starting to lose your motivation and willpower. '
-                   'The daily grind has weakened your inspiration to '
-                   'create what you used to have so much excitement '
-                   'for. On the otherhand, you might be so overwhelmed '
-                   'with excitement for so many things, you might lack '
-                   'direction on where you should go.',
-        'reading': 'lack of energy, lack of passion, boredom\n'
-                   'When the energy and passion of the Ace of Wands is '
-                   'reversed, it could likely mean that you are '
-                   'starting to lose your motivation and willpower. '
-                   'The daily grind has weakened your inspiration to '
-                   'create what you used to have so much excitement '
-                   'for. On the otherhand, you might be so overwhelmed '
-                   'with excitement for so many things, you might lack '
-                   'direction on where you should go.',
-        'title': 'Ace of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ace-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-32.png',
-        'keywords': ['competition', 'rivalry', 'conflict'],
-        'meaning': 'A battle between rivals. There is a struggle from '
-                   'all sides for dominance. Although they may seem '
-                   'intimidating at first, there is also the '
-                   'impression that  they pose no dire threat - '
-                   'possibly being more of a show of power than actual '
-                   'intention to do true harm.',
-        'reading': 'competition, rivalry, conflict\n'
-                   'A battle between rivals. There is a struggle from '
-                   'all sides for dominance. Although they may seem '
-                   'intimidating at first, there is also the '
-                   'impression that  they pose no dire threat - '
-                   'possibly being more of a show of power than actual '
-                   'intention to do true harm.',
-        'title': 'V of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-32.png',
-        'keywords': ['avoiding conflict', 'respecting differences'],
-        'meaning': 'When the competition becomes serious, instead of '
-                   'choosing to do battle, you choose to leave or '
-                   'avoid the situation completely, even if conflict '
-                   'could be potentially beneficial by allowing you to '
-                   'air out grievances and begin to move past them. '
-                   'Learn to understand your underlying motivations '
-                   'for avoiding these scuffles? Is it from fear, or '
-                   'something more benign?',
-        'reading': 'avoiding conflict, respecting differences\n'
-                   'When the competition becomes serious, instead of '
-                   'choosing to do battle, you choose to leave or '
-                   'avoid the situation completely, even if conflict '
-                   'could be potentially beneficial by allowing you to '
-                   'air out grievances and begin to move past them. '
-                   'Learn to understand your underlying motivations '
-                   'for avoiding these scuffles? Is it from fear, or '
-                   'something more benign?',
-        'title': 'V of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/five-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-33.png',
-        'keywords': ['victory', 'success', 'public reward'],
-        'meaning': 'After a tough battle, the six of wands represents '
-                   'a very public celebration of a victory. It is '
-                   'achievement as well as recognition for one’s '
-                   'achievements.',
-        'reading': 'victory, success, public reward\n'
-                   'After a tough battle, the six of wands represents '
-                   'a very public celebration of a victory. It is '
-                   'achievement as well as recognition for one’s '
-                   'achievements.',
-        'title': 'VI of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-33.png',
-        'keywords': ['excess pride', 'lack of recognition',
-                    'punishment'],
-        'meaning': 'For some reason or another, you are either '
-                   'starting to doubt your own abilities, or instead '
-                   'of getting the public recognition that you '
-                   'expected, you are now being punished. Your '
-                   'confidence has been suffering as a result of all '
-                   'of this.',
-        'reading': 'excess pride, lack of recognition, punishment\n'
-                   'For some reason or another, you are either '
-                   'starting to doubt your own abilities, or instead '
-                   'of getting the public recognition that you '
-                   'expected, you are now being punished. Your '
-                   'confidence has been suffering as a result of all '
-                   'of this.',
-        'title': 'VI of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/six-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-34.png',
-        'keywords': ['perseverance', 'defensive',
-                    'maintaining control'],
-        'meaning': 'Even with success, the battle is never over. After '
-                   'achieving a victory and a higher position, one '
-                   'must also put up a defense against the many '
-                   'competitors that want to wrench away your laurels.',
-        'reading': 'perseverance, defensive, maintaining control\n'
-                   'Even with success, the battle is never over. After '
-                   'achieving a victory and a higher position, one '
-                   'must also put up a defense against the many '
-                   'competitors that want to wrench away your laurels.',
-        'title': 'VII of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-34.png',
-        'keywords': ['give up', 'destroyed confidence', 'overwhelmed'],
-        'meaning': 'Being in a constant battle to defend yourself has '
-                   'worn down on your self-image, as you have had to '
-                   'constantly compare yourself to the rivals that '
-                   'have been eyeing your position. You are exhausted '
-                   'of fighting this battle, and you need time to '
-                   'build your confidence.',
-        'reading': 'give up, destroyed confidence, overwhelmed\n'
-                   'Being in a constant battle to defend yourself has '
-                   'worn down on your self-image, as you have had to '
-                   'constantly compare yourself to the rivals that '
-                   'have been eyeing your position. You are exhausted '
-                   'of fighting this battle, and you need time to '
-                   'build your confidence.',
-        'title': 'VII of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/seven-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'maybe'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-35.png',
-        'keywords': ['rapid action', 'movement', 'quick decisions'],
-        'meaning': 'After the struggle, there is a time of quick '
-                   'movement and unstoppable action. You have an '
-                   'overflowing of energy and spirit to add to your '
-                   'tasks and your projects. Absolute and piercing '
-                   'willpower combined with swift and sure execution.',
-        'reading': 'rapid action, movement, quick decisions\n'
-                   'After the struggle, there is a time of quick '
-                   'movement and unstoppable action. You have an '
-                   'overflowing of energy and spirit to add to your '
-                   'tasks and your projects. Absolute and piercing '
-                   'willpower combined with swift and sure execution.',
-        'title': 'VIII of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-35.png',
-        'keywords': ['panic', 'waiting', 'slowdown'],
-        'meaning': 'Though you may have unlimited energy, you are now '
-                   'being faced with many delays that hinder you, '
-                   'where you feel like you have no control over the '
-                   'circumstances. At times you can only wait. Perhaps '
-                   'this time of rest will be good for you.',
-        'reading': 'panic, waiting, slowdown\n'
-                   'Though you may have unlimited energy, you are now '
-                   'being faced with many delays that hinder you, '
-                   'where you feel like you have no control over the '
-                   'circumstances. At times you can only wait. Perhaps '
-                   'this time of rest will be good for you.',
-        'title': 'VIII of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/eight-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-36.png',
-        'keywords': ['resilience', 'grit', 'last stand'],
-        'meaning': 'You are close to achieving a victory after a time '
-                   'of battle and hard work. You have spent time '
-                   'pursuing what you believe to be right, though this '
-                   'was difficult and draining. You are reaching a '
-                   'point of exhaustion, but there is only a small way '
-                   'to go before your ultimate goal.',
-        'reading': 'resilience, grit, last stand\n'
-                   'You are close to achieving a victory after a time '
-                   'of battle and hard work. You have spent time '
-                   'pursuing what you believe to be right, though this '
-                   'was difficult and draining. You are reaching a '
-                   'point of exhaustion, but there is only a small way '
-                   'to go before your ultimate goal.',
-        'title': 'IX of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-36.png',
-        'keywords': ['exhaustion', 'fatigue',
-                    'questioning motivations'],
-        'meaning': 'At the time when you are so close to achieving '
-                   'your goals, you are now feeling as though you have '
-                   'too many responsibilities, and that you are on '
-                   'your own without any support. You must learn to '
-                   'push forward, there is only a little bit left in '
-                   'your journey.',
-        'reading': 'exhaustion, fatigue, questioning motivations\n'
-                   'At the time when you are so close to achieving '
-                   'your goals, you are now feeling as though you have '
-                   'too many responsibilities, and that you are on '
-                   'your own without any support. You must learn to '
-                   'push forward, there is only a little bit left in '
-                   'your journey.',
-        'title': 'IX of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/nine-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'yes'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-37.png',
-        'keywords': ['accomplishment', 'responsibility', 'burden'],
-        'meaning': 'The Ten of Wands indicate that you have been '
-                   'working extremely hard in order to turn something '
-                   'into fruition. At the end of that journey however, '
-                   'you find yourself being overburdened and too heavy '
-                   'with the responsibility that you created for '
-                   'yourself.',
-        'reading': 'accomplishment, responsibility, burden\n'
-                   'The Ten of Wands indicate that you have been '
-                   'working extremely hard in order to turn something '
-                   'into fruition. At the end of that journey however, '
-                   'you find yourself being overburdened and too heavy '
-                   'with the responsibility that you created for '
-                   'yourself.',
-        'title': 'X of Wands',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'no'},
-        {'image': 'https://app.labyrinthos.co/assets/decks/GTT/wands-37.png',
-        'keywords': ['inability to delegate', 'overstressed',
-                    'burnt out'],
-        'meaning': 'At this time of your life, with your achievements '
-                   'accomplished, you need to be learning how to trust '
-                   'others and hand over some responsibility. But you '
-                   'are unnecessarily holding on to the burden. What '
-                   'can you do to lighten your own load?',
-        'reading': 'inability to delegate, overstressed, burnt out\n'
-                   'At this time of your life, with your achievements '
-                   'accomplished, you need to be learning how to trust '
-                   'others and hand over some responsibility. But you '
-                   'are unnecessarily holding on to the burden. What '
-                   'can you do to lighten your own load?',
-        'title': 'X of Wands (Reversed)',
-        'url': 'https://labyrinthos.co/blogs/tarot-card-meanings-list/ten-of-wands-meaning-tarot-card-meanings',
-        'yesno': 'no'}]}
@@ -0,0 +1,106 @@
+#Event loop watchdog. A heartbeat task on the loop measures how late it wakes up, and a thread off the loop notices when
+#  the heartbeat stops and grabs the stack of whatever is hogging the loop.
+import asyncio, logging, os, sys, threading, time, traceback
+from collections import deque
+
+from modules import metrics
+
+#Anything holding the loop longer than this many seconds is recorded as a stall
+stallThreshold = float(os.environ.get('LOOP_STALL_THRESHOLD', '0.25'))
+#Seconds between heartbeats. Has to be well under the threshold for stalls to be caught while they're happening.
+heartbeatInterval = float(os.environ.get('LOOP_HEARTBEAT_INTERVAL', '0.1'))
+
+logger = logging.getLogger('butterbean.watchdog')
+
+#Everything under the app folder counts as our code when working out where a stall happened
+appDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Stall:
+    __slots__ = ('detectedAt', 'task', 'location', 'stack', 'duration')
+
+    def __init__(self, task: str, location: str, stack: str):
+        self.detectedAt = time.time()
+        self.task = task
+        self.location = location
+        self.stack = stack
+        # filled in once the loop gets going again
+        self.duration = None
+
+#Innermost frame that's in our code, since that's usually the blocking call's caller
+#* Returns string like "butterbean.py:123 in create_ticket"
+def ownCodeLocation(frame) -> str:
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(appDir) and filename != os.path.abspath(__file__):
+            return '{0}:{1} in {2}'.format(os.path.relpath(filename, appDir), frame.f_lineno, frame.f_code.co_name)
+        frame = frame.f_back
+    return 'outside the bot (library code)'
+
+class LoopWatchdog:
+    def __init__(self, threshold: float = stallThreshold, interval: float = heartbeatInterval, keep: int = 20):
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls = deque(maxlen=keep)
+        self.stallCount = 0
+        self.current = None
+        self.lastTick = None
+        self.maxLag = 0.0
+        self.totalLag = 0.0
+        self.samples = 0
+        # the watcher thread and the loop both touch current and stalls
+        self.lock = threading.Lock()
+
+    #Starts the heartbeat on the running loop and the watcher thread beside it
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.loopThread = threading.get_ident()
+        self.lastTick = time.monotonic()
+        self.task = asyncio.create_task(self.heartbeat(), name='butterbean: watchdog heartbeat')
+        self.thread = threading.Thread(target=self.watch, name='butterbean-watchdog', daemon=True)
+        self.thread.start()
+
+    async def heartbeat(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - start - self.interval)
+            self.lastTick = now
+            self.samples += 1
+            self.totalLag += lag
+            self.maxLag = max(self.maxLag, lag)
+            metrics.loopLag.observe(lag)
+            metrics.loopLagLatest.set(lag)
+            with self.lock:
+                stall, self.current = self.current, None
+            if stall is not None:
+                stall.duration = lag
+                logger.warning('Event loop stalled for %.3fs in task %s at %s\n%s', lag, stall.task, stall.location, stall.stack)
+
+    #Runs on its own thread, so it still runs while the loop is stuck
+    def watch(self):
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                if self.current is None and time.monotonic() - self.lastTick > self.threshold:
+                    self.current = self.capture()
+                    self.stalls.append(self.current)
+                    self.stallCount += 1
+                    metrics.loopStalls.inc()
+
+    def capture(self) -> Stall:
+        frame = sys._current_frames().get(self.loopThread)
+        task = asyncio.current_task(self.loop)
+        taskName = task.get_name() if task is not None else 'a loop callback'
+        if frame is None:
+            return Stall(taskName, 'unknown', '')
+        return Stall(taskName, ownCodeLocation(frame), ''.join(traceback.format_stack(frame)))
+
+    #The last few stalls, newest first
+    #* Returns list of Stall
+    def recentStalls(self, count: int = 5) -> list:
+        with self.lock:
+            return list(self.stalls)[:-count - 1:-1]
+
+    def averageLag(self) -> float:
+        return self.totalLag / self.samples if self.samples else 0.0
@@ -0,0 +1,84 @@
+#Welcome message helpers
+import asyncio, os
+
+import discord
+
+#How many reactions can be in flight at once for a single welcome message
+reactionConcurrency = int(os.environ.get('REACTION_CONCURRENCY', '3'))
+
+#Adds the pronoun reactions to welcome messages.
+#Reactions go out a few at a time instead of one after another. discord.py still waits out the per-route rate limit
+#  for us, the semaphore just keeps us from piling a whole burst's worth of requests into that bucket at once.
+class ReactionSeeder:
+    def __init__(self, emojis: list, concurrency: int = reactionConcurrency):
+        self.emojis = emojis
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.queue = asyncio.Queue()
+        self.worker = None
+
+    async def react(self, message: discord.Message, emoji: str):
+        async with self.semaphore:
+            await message.add_reaction(emoji)
+
+    # Adds every reaction to the message
+    #! Reactions can land slightly out of order, since several are in flight at once
+    async def seed(self, message: discord.Message):
+        await asyncio.gather(*(self.react(message, emoji) for emoji in self.emojis))
+
+    # Queues a welcome message for seeding in the background, so the join handler doesn't wait on it
+    def enqueue(self, message: discord.Message):
+        self.queue.put_nowait(message)
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self.run(), name='butterbean: reaction seeder')
+
+    async def run(self):
+        # one message at a time, so a join burst still only has a few reactions in flight at once
+        while not self.queue.empty():
+            message = self.queue.get_nowait()
+            try:
+                await self.seed(message)
+            except discord.HTTPException as e:
+                print('Failed to seed reactions on welcome message {0}: {1}'.format(message.id, e))
+
+#Seconds to collect joins before greeting them all in one message. 0 greets every member as soon as they join.
+welcomeBatchSeconds = float(os.environ.get('WELCOME_BATCH_SECONDS', '0'))
+
+#Collects members who join within a short window and hands them to greet(guild, members) together
+class JoinBatcher:
+    def __init__(self, greet, window: float = welcomeBatchSeconds):
+        self.greet = greet
+        self.window = window
+        # guild id -> members waiting to be greeted
+        self.pending = {}
+        self.tasks = set()
+
+    def add(self, member: discord.Member):
+        pending = self.pending.setdefault(member.guild.id, [])
+        pending.append(member)
+        # the first join of a window starts the timer, everyone after just rides along
+        if len(pending) == 1:
+            task = asyncio.create_task(self.flush(member.guild), name='butterbean: welcome batch')
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def flush(self, guild: discord.Guild):
+        await asyncio.sleep(self.window)
+        members = self.pending.pop(guild.id, [])
+        if members:
+            await self.greet(guild, members)
+
+#Splits members into groups of mentions that each fit in the space left in an embed
+#* Returns list of strings
+def mentionChunks(members: list, room: int) -> list:
+    chunks = []
+    current = ''
+    for member in members:
+        mention = member.mention if not current else ', ' + member.mention
+        if current and len(current) + len(mention) > room:
+            chunks.append(current)
+            mention = member.mention
+            current = ''
+        current += mention
+    if current:
+        chunks.append(current)
+    return chunks
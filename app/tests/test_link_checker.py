@@ -0,0 +1,69 @@
+#Runs the link checker against a local stub server. From the app folder: python -m pytest tests
+import asyncio, os, socket, sys, unittest
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.link_checker import checkLinks, unreachable
+
+#A port nothing is listening on
+def closedPort() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+class StubServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async def slow(request):
+            await asyncio.sleep(0.5)
+            return web.Response(text='meme')
+
+        async def gone(request):
+            return web.Response(status=404)
+
+        async def removed(request):
+            raise web.HTTPFound('/removed.png')
+
+        async def placeholder(request):
+            return web.Response(text='removed')
+
+        async def noHead(request):
+            if request.method == 'HEAD':
+                return web.Response(status=405)
+            return web.Response(text='meme')
+
+        app = web.Application()
+        app.router.add_get('/slow/{n}', slow)
+        app.router.add_get('/gone', gone)
+        app.router.add_get('/removed', removed)
+        app.router.add_get('/removed.png', placeholder)
+        app.router.add_route('*', '/nohead', noHead)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.base = 'http://127.0.0.1:{}'.format(self.runner.addresses[0][1])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def testQueuedLinksDontTimeOut(self):
+        # 40 half second requests two at a time take 10s, far past the timeout, but each one on its own is quick
+        links = ['{0}/slow/{1}'.format(self.base, n) for n in range(40)]
+        results = await checkLinks(links, timeout=3, perHost=2)
+        self.assertEqual(len(results), 40)
+        self.assertTrue(all(alive for status, alive in results.values()))
+
+    async def testDeadLinks(self):
+        results = await checkLinks([self.base + '/gone', self.base + '/removed', self.base + '/nohead'])
+        self.assertEqual(results[self.base + '/gone'], (404, False))
+        self.assertEqual(results[self.base + '/removed'], (200, False))
+        self.assertEqual(results[self.base + '/nohead'], (200, True))
+
+    async def testUnreachableIsUnknown(self):
+        link = 'http://127.0.0.1:{}/meme'.format(closedPort())
+        self.assertEqual((await checkLinks([link]))[link], (unreachable, None))
+
+if __name__ == '__main__':
+    unittest.main()
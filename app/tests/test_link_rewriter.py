@@ -0,0 +1,51 @@
+#Checks which links the rewriter pulls out of a message and how they come back. From the app folder: python -m pytest tests
+import os, sys, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.link_rewriter import LinkRules, linksMessage
+
+rules = LinkRules([('x.com', 'fixupx.com', None), ('instagram.com', 'ddinstagram.com', None)])
+
+def rewritten(content: str) -> list:
+    return rules.forChannel(1).rewrittenLinks(content)
+
+class RewrittenLinksTest(unittest.TestCase):
+    def testPunctuation(self):
+        self.assertEqual(rewritten('look at https://x.com/a/status/1!'), ['https://fixupx.com/a/status/1'])
+        self.assertEqual(rewritten('(see https://x.com/a), and https://x.com/b...'), ['https://fixupx.com/a', 'https://fixupx.com/b'])
+
+    def testUrlsEndingInMarkdownCharacters(self):
+        self.assertEqual(rewritten('https://x.com/jack_'), ['https://fixupx.com/jack_'])
+        self.assertEqual(rewritten('https://x.com/a/status/1?s=20_'), ['https://fixupx.com/a/status/1?s=20_'])
+        self.assertEqual(rewritten('https://www.instagram.com/some.one_/'), ['https://ddinstagram.com/some.one_/'])
+
+    def testSpoilersStaySpoilered(self):
+        self.assertEqual(rewritten('||https://x.com/a/status/1||'), ['||https://fixupx.com/a/status/1||'])
+        self.assertEqual(rewritten('||ending https://x.com/a||'), ['||https://fixupx.com/a||'])
+        self.assertEqual(rewritten('||**https://x.com/a**||'), ['||https://fixupx.com/a||'])
+
+    def testEmphasisIsDropped(self):
+        self.assertEqual(rewritten('**https://x.com/a**'), ['https://fixupx.com/a'])
+        self.assertEqual(rewritten('_https://x.com/jack_'), ['https://fixupx.com/jack'])
+        self.assertEqual(rewritten('__https://x.com/jack___'), ['https://fixupx.com/jack_'])
+
+    def testSuppressedStaySuppressed(self):
+        self.assertEqual(rewritten('<https://x.com/a>'), ['<https://fixupx.com/a>'])
+
+    def testCodeIsLeftAlone(self):
+        self.assertEqual(rewritten('`https://x.com/a`'), [])
+        self.assertEqual(rewritten('```\nhttps://x.com/a\n``` https://x.com/b'), ['https://fixupx.com/b'])
+
+    def testRepeatsAndOtherHosts(self):
+        self.assertEqual(rewritten('https://x.com/a https://x.com/a https://x.community/a https://example.com'), ['https://fixupx.com/a'])
+
+class LinksMessageTest(unittest.TestCase):
+    def testNothingFits(self):
+        self.assertEqual(linksMessage(['https://fixupx.com/' + 'a' * 2000]), '')
+
+    def testStopsAtLimit(self):
+        self.assertEqual(linksMessage(['a' * 10, 'b' * 10, 'c'], limit=21), 'a' * 10 + '\n' + 'b' * 10)
+
+if __name__ == '__main__':
+    unittest.main()